@@ -0,0 +1,78 @@
+import asyncio
+from api.sleeper_api import SleeperAPI
+
+
+class AsyncSleeperAPI:
+    """
+    asyncio counterpart to SleeperAPI for independent requests that can go out together.
+
+    Each call runs the matching SleeperAPI method on a worker thread, so it shares the pooled
+    session, retries and response cache; gathering them makes a page wait for the slowest
+    request instead of the sum of all of them.
+    """
+
+    @staticmethod
+    async def get_week_matchups(league_id, week):
+        return await asyncio.to_thread(SleeperAPI.get_week_matchups, league_id, week)
+
+    @staticmethod
+    async def get_league_info(league_id):
+        return await asyncio.to_thread(SleeperAPI.get_league_info, league_id)
+
+    @staticmethod
+    async def get_rosters(league_id):
+        return await asyncio.to_thread(SleeperAPI.get_rosters, league_id)
+
+    @staticmethod
+    async def get_user_id_from_username(username):
+        return await asyncio.to_thread(SleeperAPI.get_user_id_from_username, username)
+
+    @staticmethod
+    async def get_leagues_for_user(user_id, season="2025"):
+        return await asyncio.to_thread(SleeperAPI.get_leagues_for_user, user_id, season)
+
+    @staticmethod
+    async def load_league_week(league_id, week):
+        """
+        Fetch everything a week view needs concurrently.
+
+        Returns:
+            dict: {"league": league info, "rosters": all rosters, "matchups": the week's matchups}
+        """
+        league, rosters, matchups = await asyncio.gather(
+            AsyncSleeperAPI.get_league_info(league_id),
+            AsyncSleeperAPI.get_rosters(league_id),
+            AsyncSleeperAPI.get_week_matchups(league_id, week),
+        )
+        return {"league": league, "rosters": rosters, "matchups": matchups}
+
+    @staticmethod
+    async def load_remaining_schedule(league_id, weeks):
+        """
+        Fetch the matchups of several weeks concurrently (e.g. the rest of the regular season).
+
+        Returns:
+            dict: week -> that week's matchups
+        """
+        weeks = list(weeks)
+        matchups = await asyncio.gather(*(AsyncSleeperAPI.get_week_matchups(league_id, week) for week in weeks))
+        return dict(zip(weeks, matchups))
+
+    @staticmethod
+    async def load_user_leagues(username, season="2025", prefetch_rosters=True):
+        """
+        Resolve a username and its leagues. With prefetch_rosters, every league's rosters are
+        fetched concurrently afterwards so picking a league (roster id lookup) hits the cache.
+
+        Returns:
+            tuple: (user_id, leagues)
+        """
+        user_id = await AsyncSleeperAPI.get_user_id_from_username(username)
+        leagues = await AsyncSleeperAPI.get_leagues_for_user(user_id, season) or []
+        if prefetch_rosters and leagues:
+            # warming only: a failed prefetch just means the later lookup fetches again
+            await asyncio.gather(
+                *(AsyncSleeperAPI.get_rosters(league["league_id"]) for league in leagues),
+                return_exceptions=True,
+            )
+        return user_id, leagues
@@ -1,18 +1,74 @@
 from nba_api.stats.static import players
-from nba_api.stats.endpoints import playergamelog
+from nba_api.stats.endpoints import playergamelog, leaguegamelog
+import pandas as pd
 import re
+from api.rate_limit import TokenBucket
+from data.player_crosswalk import PlayerCrosswalk
 
 class NBAApiClient:
+    SEASON = "2025-26"
+    # shared by every thread: stats.nba.com starts throttling above ~2 requests/second
+    RATE_LIMITER = TokenBucket(rate=2.0, capacity=2)
+
     @staticmethod
     def get_player_id_from_name(player_name):
+        # O(1) normalized lookup (with trigram fuzzy fallback) before the regex scan
+        player_id = PlayerCrosswalk.nba_id_for_name(player_name)
+        if player_id is not None:
+            return player_id
+
         # Make pattern case-insensitive and allow partial matches
         pattern = ".*".join(re.escape(word) for word in player_name.split())
         results = players.find_players_by_full_name(pattern)
-        
+
         if results:
             return results[0]['id']
         else:
             raise ValueError(f"No match found for: {player_name}")
+
+    @staticmethod
+    def get_player_id_from_sleeper_id(sleeper_id, player_name=None):
+        """NBA id via the Sleeper -> NBA crosswalk, falling back to the player's name."""
+        player_id = PlayerCrosswalk.nba_id_for_sleeper_id(sleeper_id)
+        if player_id is None:
+            if player_name is None:
+                raise ValueError(f"No NBA match for Sleeper player: {sleeper_id}")
+            player_id = NBAApiClient.get_player_id_from_name(player_name)
+        return player_id
+
+    @staticmethod
+    def get_player_game_log(player_id, season=None, date_from=None):
+        """
+        Fetch a player's game log. date_from (datetime.date) limits the request to games on or after that day.
+        """
+        NBAApiClient.RATE_LIMITER.acquire()
+        return playergamelog.PlayerGameLog(
+            player_id=player_id,
+            season=season or NBAApiClient.SEASON,
+            date_from_nullable=date_from.strftime("%m/%d/%Y") if date_from else "",
+        ).get_data_frames()[0]
+
+    @staticmethod
+    def get_league_game_log(season=None, date_from=None, date_to=None):
+        """
+        Fetch every player's game rows between two dates (datetime.date, inclusive) in a single request.
+        """
+        NBAApiClient.RATE_LIMITER.acquire()
+        return leaguegamelog.LeagueGameLog(
+            player_or_team_abbreviation="P",
+            season=season or NBAApiClient.SEASON,
+            date_from_nullable=date_from.strftime("%m/%d/%Y") if date_from else "",
+            date_to_nullable=date_to.strftime("%m/%d/%Y") if date_to else "",
+        ).get_data_frames()[0]
+
+    @staticmethod
+    def set_rate_limit(requests_per_second, burst=1):
+        NBAApiClient.RATE_LIMITER = TokenBucket(rate=requests_per_second, capacity=burst)
+
     @staticmethod
-    def get_player_game_log(player_id):
-        return playergamelog.PlayerGameLog(player_id=player_id, season="2025-26").get_data_frames()[0]
\ No newline at end of file
+    def game_log_from_response(payload, result_set=0):
+        """
+        Build a game log DataFrame from a raw stats.nba.com JSON response (e.g. a recorded fixture).
+        """
+        result = payload["resultSets"][result_set]
+        return pd.DataFrame(result["rowSet"], columns=result["headers"])
@@ -0,0 +1,96 @@
+import json
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+# HTTP statuses that mean "slow down / try again" rather than a bad request
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: refills `rate` tokens per second up to `capacity`.
+
+    acquire() blocks only as long as needed, so callers run at the allowed rate instead of
+    sleeping a fixed delay after every request.
+    """
+
+    def __init__(self, rate, capacity=1):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.capacity = float(max(capacity, 1))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens=1):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+def is_throttled(error):
+    """True for errors worth retrying: timeouts, dropped connections, 429/5xx and non-JSON (throttle) pages."""
+    if isinstance(error, (requests.exceptions.Timeout, requests.exceptions.ConnectionError, json.JSONDecodeError)):
+        return True
+    if isinstance(error, requests.exceptions.HTTPError) and error.response is not None:
+        return error.response.status_code in RETRYABLE_STATUS_CODES
+    return False
+
+
+def call_with_retries(fetch, *args, max_retries=3, base_delay=1.0, **kwargs):
+    """
+    Call fetch(*args, **kwargs), retrying throttled failures with full-jitter exponential backoff.
+    """
+    for attempt in range(max_retries + 1):
+        try:
+            return fetch(*args, **kwargs)
+        except Exception as e:
+            if attempt == max_retries or not is_throttled(e):
+                raise
+            time.sleep(random.uniform(0, base_delay * 2 ** attempt))
+
+
+def fetch_concurrently(fetch, keys, max_workers=4, max_retries=3, base_delay=1.0):
+    """
+    Run fetch(key) for every key on a bounded thread pool.
+
+    Rate limiting is left to fetch (e.g. NBAApiClient's token bucket), so the pool only bounds
+    how many requests are in flight. One failing key never aborts the batch.
+
+    Args:
+        fetch (callable): Function taking a single key
+        keys (iterable): Keys to fetch, duplicates are fetched once
+        max_workers (int): Maximum concurrent calls
+        max_retries (int): Retries per key for throttled failures
+        base_delay (float): Backoff base in seconds
+
+    Returns:
+        tuple: (results, errors) dicts keyed by key
+    """
+    keys = list(dict.fromkeys(keys))
+    results, errors = {}, {}
+    if not keys:
+        return results, errors
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(keys)))) as pool:
+        futures = {
+            key: pool.submit(call_with_retries, fetch, key, max_retries=max_retries, base_delay=base_delay)
+            for key in keys
+        }
+        for key, future in futures.items():
+            try:
+                results[key] = future.result()
+            except Exception as e:
+                errors[key] = e
+    return results, errors
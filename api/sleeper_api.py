@@ -1,18 +1,192 @@
 import requests
+import hashlib
 import json
+import os
+import threading
+import time
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from data.player_directory import PlayerDirectory
 
 class SleeperAPI:
     DEFAULT_LEAGUE_ID = "1291191281669644288"
     BASE_URL = f"https://api.sleeper.app/v1/league/{DEFAULT_LEAGUE_ID}"
+    API_URL = "https://api.sleeper.app/v1"
 
+    # (connect, read) timeouts in seconds per endpoint; the players dump is several MB
+    TIMEOUTS = {
+        "players": (3.05, 60),
+        "default": (3.05, 10),
+    }
+    MAX_RETRIES = 3
+
+    # Response cache shared by the CLI scripts and the Streamlit app.
+    # Seconds before an entry is revalidated (ETag / Last-Modified) with the server.
+    CACHE_DIR = "data/cache/sleeper"
+    CACHE_ENABLED = True
+    # (the players dump is streamed by data/players_refresh.py and revalidated there)
+    CACHE_TTLS = {
+        "user": 24 * 3600,
+        "leagues": 3600,
+        "league": 3600,
+        "rosters": 300,
+        "matchups": 60,
+    }
+
+    _session = None
+    _lock = threading.Lock()
+    # endpoint -> {"count", "errors", "total_seconds", "max_seconds"}
+    _request_stats = {}
+    # url -> cache entry, mirrors the files under CACHE_DIR for this process
+    _memory_cache = {}
+
+    # ---------------------------
+    # HTTP plumbing
+    # ---------------------------
     @staticmethod
-    def get_week_matchups(league_id, week):
-        url = f"https://api.sleeper.app/v1/league/{league_id}/matchups/{week}"
-        response = requests.get(url)
-        if response.status_code == 200:
+    def get_session():
+        """Shared keep-alive session, retrying 429/5xx with exponential backoff."""
+        if SleeperAPI._session is None:
+            with SleeperAPI._lock:
+                if SleeperAPI._session is None:
+                    retry = Retry(
+                        total=SleeperAPI.MAX_RETRIES,
+                        backoff_factor=0.5,
+                        status_forcelist=(429, 500, 502, 503, 504),
+                        allowed_methods=frozenset(["GET"]),
+                        respect_retry_after_header=True,
+                        raise_on_status=False,
+                    )
+                    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+                    session = requests.Session()
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                    session.headers.update({"Accept-Encoding": "gzip, deflate", "Accept": "application/json"})
+                    SleeperAPI._session = session
+        return SleeperAPI._session
+
+    @staticmethod
+    def _get(endpoint, url, **kwargs):
+        timeout = SleeperAPI.TIMEOUTS.get(endpoint, SleeperAPI.TIMEOUTS["default"])
+        start = time.perf_counter()
+        failed = True
+        try:
+            response = SleeperAPI.get_session().get(url, timeout=timeout, **kwargs)
+            failed = response.status_code >= 400
+            return response
+        finally:
+            SleeperAPI._record_request(endpoint, time.perf_counter() - start, failed)
+
+    @staticmethod
+    def _record_request(endpoint, seconds, failed):
+        with SleeperAPI._lock:
+            stats = SleeperAPI._request_stats.setdefault(
+                endpoint, {"count": 0, "errors": 0, "total_seconds": 0.0, "max_seconds": 0.0}
+            )
+            stats["count"] += 1
+            stats["errors"] += int(failed)
+            stats["total_seconds"] += seconds
+            stats["max_seconds"] = max(stats["max_seconds"], seconds)
+
+    @staticmethod
+    def get_request_stats():
+        """Per-endpoint request counts and latencies (seconds) since start-up."""
+        with SleeperAPI._lock:
+            return {
+                endpoint: {**stats, "mean_seconds": stats["total_seconds"] / stats["count"]}
+                for endpoint, stats in SleeperAPI._request_stats.items()
+            }
+
+    # ---------------------------
+    # Response cache
+    # ---------------------------
+    @staticmethod
+    def _cache_path(url):
+        return os.path.join(SleeperAPI.CACHE_DIR, hashlib.sha1(url.encode("utf-8")).hexdigest() + ".json")
+
+    @staticmethod
+    def _read_cache(url):
+        entry = SleeperAPI._memory_cache.get(url)
+        if entry is None:
+            try:
+                with open(SleeperAPI._cache_path(url), "r", encoding="utf-8") as f:
+                    entry = json.load(f)
+            except (OSError, ValueError):
+                return None
+            SleeperAPI._memory_cache[url] = entry
+        return entry
+
+    @staticmethod
+    def _write_cache(url, entry):
+        SleeperAPI._memory_cache[url] = entry
+        os.makedirs(SleeperAPI.CACHE_DIR, exist_ok=True)
+        path = SleeperAPI._cache_path(url)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def clear_cache():
+        SleeperAPI._memory_cache.clear()
+        if os.path.isdir(SleeperAPI.CACHE_DIR):
+            for name in os.listdir(SleeperAPI.CACHE_DIR):
+                if name.endswith(".json"):
+                    os.remove(os.path.join(SleeperAPI.CACHE_DIR, name))
+
+    @staticmethod
+    def _get_json(endpoint, url, error_message):
+        """
+        GET a JSON endpoint through the response cache.
+
+        Fresh entries (younger than CACHE_TTLS[endpoint]) are served without a request; stale ones
+        are revalidated with If-None-Match / If-Modified-Since so an unchanged resource costs a 304.
+        """
+        if not SleeperAPI.CACHE_ENABLED:
+            response = SleeperAPI._get(endpoint, url)
+            if response.status_code != 200:
+                raise Exception(f"{error_message}: {response.status_code}")
             return response.json()
-        else:
-            raise Exception(f"Failed to fetch data: {response.status_code}")
+
+        entry = SleeperAPI._read_cache(url)
+        now = time.time()
+        if entry is not None and now - entry["fetched_at"] < SleeperAPI.CACHE_TTLS.get(endpoint, 0):
+            return entry["body"]
+
+        headers = {}
+        if entry is not None:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        response = SleeperAPI._get(endpoint, url, headers=headers)
+        if response.status_code == 304 and entry is not None:
+            SleeperAPI._write_cache(url, {**entry, "fetched_at": now})
+            return entry["body"]
+        if response.status_code != 200:
+            raise Exception(f"{error_message}: {response.status_code}")
+
+        body = response.json()
+        if body is None:
+            # Sleeper answers unknown users/leagues with null; don't pin that for a whole TTL
+            return body
+        SleeperAPI._write_cache(url, {
+            "url": url,
+            "fetched_at": now,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "body": body,
+        })
+        return body
+
+    # ---------------------------
+    # Endpoints
+    # ---------------------------
+    @staticmethod
+    def get_week_matchups(league_id, week):
+        url = f"{SleeperAPI.API_URL}/league/{league_id}/matchups/{week}"
+        return SleeperAPI._get_json("matchups", url, "Failed to fetch data")
 
     @staticmethod
     def get_my_team_data(data, roster_id):
@@ -27,79 +201,61 @@ class SleeperAPI:
             if matchup['matchup_id'] == matchup_id and matchup['roster_id'] != team_id:
                 return matchup
         raise Exception("Opponent team ID not found in the data")
-    
+
     @staticmethod
     def get_name_from_sleeper_id(sleeper_id):
-        with open("data/json/nba_players.json", "r", encoding="utf-8") as f:
-            id_to_name = json.load(f)
-        return id_to_name.get(sleeper_id, "Unknown Player")
-    
+        return PlayerDirectory.name_for(sleeper_id)
+
     @staticmethod
     def get_league_info(league_id):
-        url = f"https://api.sleeper.app/v1/league/{league_id}"
-        response = requests.get(url)
-        if response.status_code == 200:
-            return response.json()
-        else:
-            raise Exception(f"Failed to fetch league info: {response.status_code}")
-        
+        url = f"{SleeperAPI.API_URL}/league/{league_id}"
+        return SleeperAPI._get_json("league", url, "Failed to fetch league info")
+
+    @staticmethod
+    def stream_players(headers=None):
+        """Streaming GET of the players dump; the caller iterates and closes the response."""
+        url = f"{SleeperAPI.API_URL}/players/nba"
+        return SleeperAPI._get("players", url, headers=headers or {}, stream=True)
+
     @staticmethod
     def download_players_complete_info():
-        url = 'https://api.sleeper.app/v1/players/nba'
-        response = requests.get(url)
-        with open("data/json/players_complete_info.json", "w") as f:
-            json.dump(response.json(), f, indent=2)
-    
+        # imported here: the refresh job itself depends on SleeperAPI
+        from data.players_refresh import refresh_players
+        return refresh_players()
+
 
     @staticmethod
     def get_rosters(league_id):
-        url = f"https://api.sleeper.app/v1/league/{league_id}/rosters"
-        response = requests.get(url)
-        if response.status_code == 200:
-            return response.json()
-        else:
-            raise Exception(f"Failed to fetch rosters: {response.status_code}")
-        
+        url = f"{SleeperAPI.API_URL}/league/{league_id}/rosters"
+        return SleeperAPI._get_json("rosters", url, "Failed to fetch rosters")
+
     @staticmethod
     def get_users_roster_id(league_id, user_id):
-        url = f"https://api.sleeper.app/v1/league/{league_id}/rosters"
-        response = requests.get(url)
-        if response.status_code == 200:
-            rosters = response.json()
-            for roster in rosters:
-                if roster['owner_id'] == user_id:
-                    return roster['roster_id']
-            raise Exception("User ID not found in rosters")
-        else:
-            raise Exception(f"Failed to fetch rosters: {response.status_code}")
-    
+        rosters = SleeperAPI.get_rosters(league_id)
+        for roster in rosters:
+            if roster['owner_id'] == user_id:
+                return roster['roster_id']
+        raise Exception("User ID not found in rosters")
+
 
     @staticmethod
     def get_user_id_from_username(username):
-        url = f"https://api.sleeper.app/v1/user/{username}"
-        response = requests.get(url)
-        if response.status_code == 200:
-            user_data = response.json()
-            return user_data['user_id']
-        else:
-            raise Exception(f"Failed to fetch user ID: {response.status_code}")
-        
+        url = f"{SleeperAPI.API_URL}/user/{username}"
+        user_data = SleeperAPI._get_json("user", url, "Failed to fetch user ID")
+        return user_data['user_id']
+
 
     @staticmethod
     def get_leagues_for_user(user_id, season="2025"):
-        url = f"https://api.sleeper.app/v1/user/{user_id}/leagues/nba/{season}"
-        response = requests.get(url)
-        if response.status_code == 200:
-            return response.json()
-        else:
-            raise Exception(f"Failed to fetch leagues: {response.status_code}")
-        
+        url = f"{SleeperAPI.API_URL}/user/{user_id}/leagues/nba/{season}"
+        return SleeperAPI._get_json("leagues", url, "Failed to fetch leagues")
+
 
     @staticmethod
     def get_league_id():
         return SleeperAPI.DEFAULT_LEAGUE_ID
-    
+
     @staticmethod
     def set_league_id(league_id):
         SleeperAPI.DEFAULT_LEAGUE_ID = league_id
-        SleeperAPI.BASE_URL = f"https://api.sleeper.app/v1/league/{league_id}"
\ No newline at end of file
+        SleeperAPI.BASE_URL = f"https://api.sleeper.app/v1/league/{league_id}"
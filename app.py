@@ -1,15 +1,23 @@
+import asyncio
 import json
 import os
 import streamlit as st
 import numpy as np
 import pandas as pd
 from api.sleeper_api import SleeperAPI
+from api.async_sleeper_api import AsyncSleeperAPI
+from data.player_directory import PlayerDirectory
+from data.player_store import PlayerMetadataStore
 from utils.helpers import (
     get_my_team_and_opponent_team,
-    player_names_to_fantasy_stats,
+    get_week_matchup_pairs,
+    get_league_week_players,
+    sleeper_ids_to_fantasy_stats,
     get_current_week
 )
 from simulation.simulation import FantasyNBASimulation
+from simulation.season import FantasySeasonSimulation
+from simulation.thresholds import LockThresholdCache
 
 # Page configuration
 st.set_page_config(
@@ -34,6 +42,9 @@ if 'opp_player_stats' not in st.session_state:
     st.session_state.opp_player_stats = {}
 if 'simulation_results' not in st.session_state:
     st.session_state.simulation_results = None
+if 'lock_thresholds' not in st.session_state:
+    # rebuilt only when a projection, games left or lock changes, not on live score ticks
+    st.session_state.lock_thresholds = LockThresholdCache()
 if 'week' not in st.session_state:
     st.session_state.week = get_current_week()
 if 'players_complete_info' not in st.session_state:
@@ -41,7 +52,7 @@ if 'players_complete_info' not in st.session_state:
 
 # Sidebar for navigation
 st.sidebar.title("🏀 NBA Fantasy Simulator")
-page = st.sidebar.radio("Navigate", ["Setup", "Weekly Simulation"])
+page = st.sidebar.radio("Navigate", ["Setup", "Weekly Simulation", "League Week"])
 
 # ============================================================================
 # HELPER FUNCTIONS
@@ -55,21 +66,14 @@ def load_player_info_from_file():
             return json.load(f)
     return None
 
-@st.cache_data
+@st.cache_resource
 def load_players_complete_info():
-    """Load complete player information"""
-    if os.path.exists("data/json/players_complete_info.json"):
-        with open("data/json/players_complete_info.json", "r", encoding="utf-8") as f:
-            return json.load(f)
-    return {}
+    """Memory-mapped player metadata store, shared by all sessions (built from players_complete_info.json)"""
+    return PlayerMetadataStore.open()
 
-@st.cache_data
 def load_players_name_map():
-    """Load player ID to name mapping"""
-    if os.path.exists("data/json/nba_players.json"):
-        with open("data/json/nba_players.json", "r", encoding="utf-8") as f:
-            return json.load(f)
-    return {}
+    """Player ID to name mapping, shared by all sessions and reloaded when the file changes"""
+    return PlayerDirectory.all()
 
 def save_player_info(player_info):
     """Save player info to player_info.json"""
@@ -79,52 +83,34 @@ def save_player_info(player_info):
     # Clear the cache so the new file contents are loaded
     load_player_info_from_file.clear()
 
-@st.cache_data
-def get_user_leagues(user_id):
-    """Fetch leagues for a user"""
-    return SleeperAPI.get_leagues_for_user(user_id)
-
-@st.cache_data
-def get_user_id(username):
-    """Get user ID from username"""
-    return SleeperAPI.get_user_id_from_username(username)
-
 @st.cache_data
 def get_roster_id(league_id, user_id):
     """Get roster ID for a user in a league"""
     return SleeperAPI.get_users_roster_id(league_id, user_id)
 
-@st.cache_data(ttl=300)
-def get_rosters(league_id):
-    """Get all rosters for a league"""
-    return SleeperAPI.get_rosters(league_id)
-
-@st.cache_data(ttl=300)
-def get_matchups(league_id, week):
-    """Get matchups for a specific week"""
-    return SleeperAPI.get_week_matchups(league_id, week)
-
 @st.cache_data(ttl=3600)
 def get_league_info(league_id):
     """Get league information including positions and scoring"""
     return SleeperAPI.get_league_info(league_id)
 
+@st.cache_data(ttl=60)
+def load_league_week(league_id, week):
+    """Get league info, rosters and the week's matchups concurrently"""
+    return asyncio.run(AsyncSleeperAPI.load_league_week(league_id, week))
+
+@st.cache_data(ttl=3600)
+def load_remaining_schedule(league_id, weeks):
+    """Get the matchups of every remaining regular-season week concurrently"""
+    return asyncio.run(AsyncSleeperAPI.load_remaining_schedule(league_id, weeks))
+
+@st.cache_data
+def load_user_leagues(username):
+    """Get user ID and leagues, prefetching every league's rosters"""
+    return asyncio.run(AsyncSleeperAPI.load_user_leagues(username))
+
 def can_player_fill_position(player_id, position, players_info):
     """Check if a player can fill a specific roster position"""
-    if position == "BN":
-        return True
-    player_info = players_info.get(str(player_id))
-    if not player_info:
-        return False
-    fantasy_positions = player_info.get("fantasy_positions", [])
-    if position == "UTIL":
-        return len(fantasy_positions) > 0
-    elif position == "G":
-        return "PG" in fantasy_positions or "SG" in fantasy_positions
-    elif position == "F":
-        return "SF" in fantasy_positions or "PF" in fantasy_positions
-    else:
-        return position in fantasy_positions
+    return players_info.can_fill(player_id, position)
 
 def get_player_positions(player_id, players_info):
     """Get the fantasy positions a player can play"""
@@ -345,8 +331,7 @@ if page == "Setup":
     if submit and username:
         with st.spinner("Fetching user information..."):
             try:
-                user_id = get_user_id(username)
-                leagues = get_user_leagues(user_id)
+                user_id, leagues = load_user_leagues(username)
 
                 if not leagues:
                     st.error("No leagues found for this user.")
@@ -435,6 +420,7 @@ elif page == "Weekly Simulation":
     league_info = st.session_state.league_info
     league_name = league_info.get('name', 'Unknown League')
     roster_positions = league_info.get('roster_positions', [])
+    scoring_settings = league_info.get('scoring_settings')
 
     if st.session_state.players_complete_info is None:
         st.session_state.players_complete_info = load_players_complete_info()
@@ -461,7 +447,9 @@ elif page == "Weekly Simulation":
             st.session_state.week = week
             with st.spinner("Loading matchup data..."):
                 try:
-                    rosters = get_rosters(player_info['main_league_id'])
+                    week_data = load_league_week(player_info['main_league_id'], week)
+                    st.session_state.league_info = week_data['league']
+                    rosters = week_data['rosters']
 
                     user_roster = None
                     for roster in rosters:
@@ -473,7 +461,7 @@ elif page == "Weekly Simulation":
                         st.error("Could not find your roster")
                         st.stop()
 
-                    matchups = get_matchups(player_info['main_league_id'], week)
+                    matchups = week_data['matchups']
                     user_matchup_data, opp_matchup_data = get_my_team_and_opponent_team(
                         player_info['roster_id'],
                         matchups
@@ -517,19 +505,16 @@ elif page == "Weekly Simulation":
                         roster_positions
                     )
 
-                    your_names = [name_map.get(p, 'Unknown') for p in your_starters if p]
-                    opp_names = [name_map.get(p, 'Unknown') for p in opp_starters if p]
-
-                    your_stats = player_names_to_fantasy_stats(your_names)
-                    opp_stats = player_names_to_fantasy_stats(opp_names)
+                    your_stats = sleeper_ids_to_fantasy_stats([p for p in your_starters if p], scoring_settings)
+                    opp_stats = sleeper_ids_to_fantasy_stats([p for p in opp_starters if p], scoring_settings)
 
                     # Build player stats dict
                     st.session_state.your_player_stats = {
                         player_id: {
                             "name": name_map.get(player_id, 'Unknown'),
-                            "mean": your_stats.get(name_map.get(player_id, 'Unknown'), (0, 0, 0))[0],
-                            "std": your_stats.get(name_map.get(player_id, 'Unknown'), (0, 0, 0))[1],
-                            "games_played": your_stats.get(name_map.get(player_id, 'Unknown'), (0, 0, 0))[2],
+                            "mean": your_stats.get(player_id, (0, 0, 0))[0],
+                            "std": your_stats.get(player_id, (0, 0, 0))[1],
+                            "games_played": your_stats.get(player_id, (0, 0, 0))[2],
                             "games_left": 1,
                             "locked": None
                         }
@@ -539,9 +524,9 @@ elif page == "Weekly Simulation":
                     st.session_state.opp_player_stats = {
                         player_id: {
                             "name": name_map.get(player_id, 'Unknown'),
-                            "mean": opp_stats.get(name_map.get(player_id, 'Unknown'), (0, 0, 0))[0],
-                            "std": opp_stats.get(name_map.get(player_id, 'Unknown'), (0, 0, 0))[1],
-                            "games_played": opp_stats.get(name_map.get(player_id, 'Unknown'), (0, 0, 0))[2],
+                            "mean": opp_stats.get(player_id, (0, 0, 0))[0],
+                            "std": opp_stats.get(player_id, (0, 0, 0))[1],
+                            "games_played": opp_stats.get(player_id, (0, 0, 0))[2],
                             "games_left": 1,
                             "locked": None
                         }
@@ -591,15 +576,14 @@ elif page == "Weekly Simulation":
 
                         # Refresh stats when lineup changes
                         your_starters = get_starting_players_from_lineup(new_your_lineup, roster_positions)
-                        your_names = [name_map.get(p, 'Unknown') for p in your_starters if p]
-                        your_stats = player_names_to_fantasy_stats(your_names)
+                        your_stats = sleeper_ids_to_fantasy_stats([p for p in your_starters if p], scoring_settings)
 
                         st.session_state.your_player_stats = {
                             player_id: {
                                 "name": name_map.get(player_id, 'Unknown'),
-                                "mean": your_stats.get(name_map.get(player_id, 'Unknown'), (0, 0, 0))[0],
-                                "std": your_stats.get(name_map.get(player_id, 'Unknown'), (0, 0, 0))[1],
-                                "games_played": your_stats.get(name_map.get(player_id, 'Unknown'), (0, 0, 0))[2],
+                                "mean": your_stats.get(player_id, (0, 0, 0))[0],
+                                "std": your_stats.get(player_id, (0, 0, 0))[1],
+                                "games_played": your_stats.get(player_id, (0, 0, 0))[2],
                                 "games_left": st.session_state.your_player_stats.get(player_id, {}).get("games_left", 1),
                                 "locked": st.session_state.your_player_stats.get(player_id, {}).get("locked", None)
                             }
@@ -609,6 +593,56 @@ elif page == "Weekly Simulation":
                         st.success("✅ Lineup saved! Stats refreshed.")
                         st.rerun()
 
+                if st.button("🧠 Optimize Lineup", key="optimize_your_lineup"):
+                    with st.spinner("Searching lineups..."):
+                        try:
+                            roster_ids = [p for p in your_all_players if p]
+                            roster_stats = sleeper_ids_to_fantasy_stats(roster_ids, scoring_settings)
+                            roster_players = {
+                                player_id: {
+                                    "name": name_map.get(player_id, 'Unknown'),
+                                    "mean": roster_stats.get(player_id, (0, 0, 0))[0],
+                                    "std": roster_stats.get(player_id, (0, 0, 0))[1],
+                                    "games_left": st.session_state.your_player_stats.get(player_id, {}).get("games_left", 1),
+                                    "locked": st.session_state.your_player_stats.get(player_id, {}).get("locked", None)
+                                }
+                                for player_id in roster_ids
+                            }
+                            optimized = FantasyNBASimulation.optimize_lineup(
+                                roster_players,
+                                roster_positions,
+                                players_info.can_fill,
+                                list(st.session_state.opp_player_stats.values()),
+                                current=get_starting_players_from_lineup(new_your_lineup, roster_positions)
+                            )
+                            if optimized.get("error"):
+                                st.warning(optimized["error"])
+                            else:
+                                # starters into their matched slots, everyone else onto the bench
+                                bench_slots = [i for i, position in enumerate(roster_positions) if position == "BN"]
+                                bench_players = [p for p in roster_ids if p not in optimized['starters']]
+                                optimized_lineup = {i: None for i in range(len(roster_positions))}
+                                optimized_lineup.update(optimized['slots'])
+                                optimized_lineup.update(zip(bench_slots, bench_players))
+                                st.session_state.your_roster['lineup'] = optimized_lineup
+                                st.session_state.your_player_stats = {
+                                    player_id: dict(roster_players[player_id], games_played=roster_stats.get(player_id, (0, 0, 0))[2])
+                                    for player_id in optimized['starters']
+                                }
+                                current_p_win = optimized['current_p_win']
+                                st.session_state.lineup_optimizer_message = (
+                                    f"✅ Optimized lineup: win % {optimized['p_win'] * 100:.1f}"
+                                    + (f" (current lineup {current_p_win * 100:.1f})" if current_p_win is not None else "")
+                                )
+                                st.rerun()
+                        except Exception as e:
+                            st.error(f"Lineup optimizer error: {str(e)}")
+                            import traceback
+                            st.code(traceback.format_exc())
+
+                if st.session_state.get('lineup_optimizer_message'):
+                    st.success(st.session_state.lineup_optimizer_message)
+
             with sub_tab2:
                 st.write("**Edit Player Statistics** - Adjust mean, std, games left, and locked scores")
 
@@ -690,15 +724,14 @@ elif page == "Weekly Simulation":
 
                         # Refresh stats when lineup changes
                         opp_starters = get_starting_players_from_lineup(new_opp_lineup, roster_positions)
-                        opp_names = [name_map.get(p, 'Unknown') for p in opp_starters if p]
-                        opp_stats = player_names_to_fantasy_stats(opp_names)
+                        opp_stats = sleeper_ids_to_fantasy_stats([p for p in opp_starters if p], scoring_settings)
 
                         st.session_state.opp_player_stats = {
                             player_id: {
                                 "name": name_map.get(player_id, 'Unknown'),
-                                "mean": opp_stats.get(name_map.get(player_id, 'Unknown'), (0, 0, 0))[0],
-                                "std": opp_stats.get(name_map.get(player_id, 'Unknown'), (0, 0, 0))[1],
-                                "games_played": opp_stats.get(name_map.get(player_id, 'Unknown'), (0, 0, 0))[2],
+                                "mean": opp_stats.get(player_id, (0, 0, 0))[0],
+                                "std": opp_stats.get(player_id, (0, 0, 0))[1],
+                                "games_played": opp_stats.get(player_id, (0, 0, 0))[2],
                                 "games_left": st.session_state.opp_player_stats.get(player_id, {}).get("games_left", 1),
                                 "locked": st.session_state.opp_player_stats.get(player_id, {}).get("locked", None)
                             }
@@ -765,19 +798,29 @@ elif page == "Weekly Simulation":
         # Simulation controls
         st.subheader("🎲 Run Simulation")
 
-        col1, col2 = st.columns([1, 3])
+        col1, col2, col3 = st.columns([1, 1, 2])
         with col1:
+            target_precision_pct = st.number_input(
+                "Target Precision (± win %)",
+                min_value=0.1,
+                max_value=5.0,
+                value=0.5,
+                step=0.1,
+                help="Simulations run in batches until the 95% confidence interval is this narrow"
+            )
+
+        with col2:
             num_sims = st.number_input(
-                "Number of Simulations",
+                "Max Simulations",
                 min_value=1000,
-                max_value=100000,
-                value=10000,
-                step=1000
+                max_value=1000000,
+                value=200000,
+                step=10000
             )
 
-        with col2:
+        with col3:
             if st.button("🚀 Run Monte Carlo Simulation", type="primary"):
-                with st.spinner(f"Running {num_sims:,} simulations..."):
+                with st.spinner(f"Running up to {num_sims:,} simulations..."):
                     try:
                         # Build player data from stats
                         your_players = [
@@ -806,15 +849,17 @@ elif page == "Weekly Simulation":
                         baseline = FantasyNBASimulation.estimate_win_probability(
                             your_players,
                             opp_players,
-                            sims=num_sims
+                            target_precision=target_precision_pct / 100,
+                            max_sims=num_sims
                         )
 
                         # Get lock recommendations
                         recommendations = FantasyNBASimulation.recommend_best_lock(
                             your_players,
                             opp_players,
-                            sims=num_sims,
-                            min_delta=0.002
+                            min_delta=0.002,
+                            target_precision=target_precision_pct / 100,
+                            max_sims=num_sims
                         )
 
                         st.session_state.simulation_results = {
@@ -852,16 +897,77 @@ elif page == "Weekly Simulation":
                 st.metric("Expected Margin", f"{expected_margin:.1f} pts")
 
             with col3:
-                your_avg = np.mean(baseline['your_totals'])
+                your_avg = baseline['your_mean']
                 st.metric("Your Avg Score", f"{your_avg:.1f} pts")
 
+            ci_low, ci_high = baseline['ci']
+            st.caption(
+                f"95% CI for win probability: {ci_low * 100:.1f}% - {ci_high * 100:.1f}% "
+                f"({baseline['sims_used']:,} simulations, seed {baseline['seed']})"
+            )
+
             # Distribution visualization
             st.subheader("Score Distribution")
-            hist_data = pd.DataFrame({
-                'Your Team': baseline['your_totals'],
-                'Opponent': baseline['opp_totals']
-            })
-            st.line_chart(hist_data.sample(min(1000, len(hist_data))))
+            # the simulation keeps fixed-bin histograms instead of per-sim arrays
+            histograms = baseline['histograms']
+            hist_data = pd.concat([
+                pd.Series(
+                    histograms[key]['counts'] / max(histograms[key]['counts'].sum(), 1),
+                    index=np.round((histograms[key]['edges'][:-1] + histograms[key]['edges'][1:]) / 2, 1),
+                    name=label
+                )
+                for key, label in (('your', 'Your Team'), ('opp', 'Opponent'))
+            ], axis=1).fillna(0).sort_index()
+            st.line_chart(hist_data)
+
+            # Optimal lock policy: cheap enough to recompute on every rerun
+            lock_policy = FantasyNBASimulation.optimal_lock_policy(results['your_players'], results['opp_players'])
+            if lock_policy['players']:
+                with st.expander("📋 Lock Thresholds by Game"):
+                    st.caption(
+                        "Lock a game's score if it reaches the threshold; an unlocked game's score is dropped "
+                        "and the last game's score is always kept. The win % here assumes that lock-or-drop "
+                        "rule, so it differs from the headline Win Probability and the Lock Now? check, which "
+                        "count each unlocked player's best remaining game."
+                    )
+                    st.dataframe(
+                        pd.DataFrame([
+                            {
+                                "Player": p['player_name'],
+                                **{f"Game {g + 1}": "never" if t is None else f"{t:.1f}" for g, t in enumerate(p['thresholds'])},
+                                "Win % (lock-or-drop)": round(p['p_win_if_wait'] * 100, 1)
+                            }
+                            for p in lock_policy['players']
+                        ]),
+                        hide_index=True,
+                        use_container_width=True
+                    )
+
+            # Instant lock check against the cached break-even scores
+            unlocked = [i for i, p in enumerate(results['your_players']) if p['locked'] is None]
+            if unlocked:
+                with st.expander("⚡ Lock Now?"):
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        check_index = st.selectbox(
+                            "Player",
+                            unlocked,
+                            format_func=lambda i: results['your_players'][i]['name'],
+                            key="lock_check_player"
+                        )
+                    with col2:
+                        check_score = st.number_input(
+                            "Live Score", min_value=0.0, value=0.0, step=0.5, key="lock_check_score"
+                        )
+                    decision = st.session_state.lock_thresholds.decide(
+                        results['your_players'], results['opp_players'], check_index, check_score
+                    )
+                    verdict = "🔒 Lock" if decision['lock'] else "⏳ Wait"
+                    st.write(
+                        f"**{verdict}** - break-even score {decision['break_even']:.1f} "
+                        f"(win % {decision['p_win_if_lock'] * 100:.1f} locked vs "
+                        f"{decision['p_win_if_not_lock'] * 100:.1f} not locked)"
+                    )
 
             # Lock recommendations
             if recommendations['top_recommendation']:
@@ -903,6 +1009,143 @@ elif page == "Weekly Simulation":
             else:
                 st.info("No strong lock recommendations at this time.")
 
+# ============================================================================
+# PAGE 3: LEAGUE WEEK
+# ============================================================================
+
+elif page == "League Week":
+    st.title("🗓️ League Week Odds")
+
+    if st.session_state.player_info is None:
+        cached_info = load_player_info_from_file()
+        if cached_info:
+            st.session_state.player_info = cached_info
+        else:
+            st.warning("⚠️ Please complete the **Setup** first.")
+            st.stop()
+
+    player_info = st.session_state.player_info
+
+    col1, col2, col3 = st.columns([1, 1, 2])
+    with col1:
+        league_week = st.number_input(
+            "Week Number",
+            min_value=1,
+            max_value=26,
+            value=st.session_state.week,
+            step=1,
+            key="league_week_input"
+        )
+    with col2:
+        league_sims = st.number_input(
+            "Simulations",
+            min_value=1000,
+            max_value=200000,
+            value=20000,
+            step=1000,
+            key="league_week_sims"
+        )
+
+    with col3:
+        if st.button("🚀 Simulate Every Matchup", type="primary"):
+            with st.spinner("Loading rosters and simulating the week..."):
+                try:
+                    week_data = load_league_week(player_info['main_league_id'], league_week)
+                    matchups = week_data['matchups']
+                    pairs = get_week_matchup_pairs(matchups)
+                    # one stats load for every starter in the league
+                    teams = get_league_week_players(matchups, week_data['league'].get('scoring_settings'))
+                    league_results = FantasyNBASimulation.simulate_league_week(teams, pairs, sims=league_sims)
+
+                    rows = []
+                    for matchup in league_results['matchups']:
+                        home, away = matchup['roster_ids']
+                        rows.append({
+                            "Matchup": f"Team {home} vs Team {away}",
+                            "Win % (first)": round(matchup['p_win'] * 100, 1),
+                            "Win % (second)": round((1 - matchup['p_win'] - matchup['p_tie']) * 100, 1),
+                            "Expected Margin": round(matchup['expected_margin'], 1),
+                            "Margin 5%": round(matchup['margin_quantiles'][0.05], 1),
+                            "Margin 95%": round(matchup['margin_quantiles'][0.95], 1),
+                            "Yours": player_info['roster_id'] in (home, away)
+                        })
+                    st.session_state.league_week_results = pd.DataFrame(rows)
+                    st.success(f"✅ Simulated {len(pairs)} matchups ({league_results['sims_used']:,} sims each)")
+                except Exception as e:
+                    st.error(f"League simulation error: {str(e)}")
+                    import traceback
+                    st.code(traceback.format_exc())
+
+    if st.session_state.get('league_week_results') is not None:
+        st.dataframe(st.session_state.league_week_results, hide_index=True, use_container_width=True)
+
+    st.divider()
+    st.subheader("🏆 Playoff Odds")
+
+    col1, col2 = st.columns([1, 3])
+    with col1:
+        games_per_week = st.number_input(
+            "Games per Week",
+            min_value=1,
+            max_value=5,
+            value=3,
+            step=1,
+            help="Games assumed for every starter in each remaining week",
+            key="season_games_per_week"
+        )
+        seasons = st.number_input(
+            "Seasons",
+            min_value=1000,
+            max_value=200000,
+            value=50000,
+            step=1000,
+            key="season_sims"
+        )
+
+    with col2:
+        if st.button("🔮 Simulate Rest of Season"):
+            with st.spinner("Loading the schedule and simulating the season..."):
+                try:
+                    week_data = load_league_week(player_info['main_league_id'], league_week)
+                    playoff_teams, byes, playoff_week_start = FantasySeasonSimulation.playoff_format(week_data['league'])
+                    last_week = (playoff_week_start or league_week + 1) - 1
+                    schedule_weeks = load_remaining_schedule(
+                        player_info['main_league_id'], tuple(range(league_week, last_week + 1))
+                    )
+                    schedule = [get_week_matchup_pairs(matchups) for _, matchups in sorted(schedule_weeks.items())]
+                    # current starters stand in for every remaining week
+                    teams = get_league_week_players(
+                        week_data['matchups'], week_data['league'].get('scoring_settings'), games_left=games_per_week
+                    )
+                    standings = FantasySeasonSimulation.standings_from_rosters(week_data['rosters'])
+                    season_results = FantasySeasonSimulation.simulate_season(
+                        teams, schedule, standings, playoff_teams=playoff_teams, byes=byes, seasons=seasons
+                    )
+
+                    rows = []
+                    for roster_id, odds in season_results['teams'].items():
+                        record = standings.get(roster_id, {})
+                        rows.append({
+                            "Team": f"Team {roster_id}",
+                            "Record": f"{record.get('wins', 0)}-{record.get('losses', 0)}-{record.get('ties', 0)}",
+                            "Expected Wins": round(odds['expected_wins'], 1),
+                            "Playoff %": round(odds['playoff_prob'] * 100, 1),
+                            "Bye %": round(odds['bye_prob'] * 100, 1),
+                            "Yours": roster_id == player_info['roster_id']
+                        })
+                    st.session_state.season_results = pd.DataFrame(rows).sort_values("Playoff %", ascending=False)
+                    st.success(
+                        f"✅ Simulated {len(schedule)} remaining weeks {season_results['seasons']:,} times "
+                        f"(seed {season_results['seed']})"
+                    )
+                except Exception as e:
+                    st.error(f"Season simulation error: {str(e)}")
+                    import traceback
+                    st.code(traceback.format_exc())
+
+    if st.session_state.get('season_results') is not None:
+        st.dataframe(st.session_state.season_results, hide_index=True, use_container_width=True)
+
 # Footer
 st.sidebar.divider()
 st.sidebar.caption("NBA Fantasy Simulator v3.0")
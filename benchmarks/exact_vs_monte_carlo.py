@@ -0,0 +1,65 @@
+"""
+Cross-check the exact (FFT convolution) engine against Monte Carlo.
+
+Exits non-zero if any matchup's exact P(win) falls outside the Monte Carlo confidence band.
+Run with: python -m benchmarks.exact_vs_monte_carlo [--sims 400000]
+"""
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from simulation.simulation import FantasyNBASimulation
+from benchmarks.lock_variance import YOUR_PLAYERS, OPP_PLAYERS
+
+
+def _roster(rng, size, locked_share=0.2):
+    players = []
+    for i in range(size):
+        player = {
+            "name": f"P{i}",
+            "mean": float(rng.uniform(8, 45)),
+            "std": float(rng.uniform(2, 12)),
+            "games_left": int(rng.integers(0, 5)),
+            "locked": None,
+        }
+        if rng.random() < locked_share:
+            player["locked"] = float(rng.uniform(5, 50))
+        players.append(player)
+    return players
+
+
+def matchups(rng, count):
+    yield "close matchup", YOUR_PLAYERS, OPP_PLAYERS
+    for i in range(count):
+        yield f"random rosters #{i + 1}", _roster(rng, 10), _roster(rng, 10)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sims", type=int, default=400000)
+    parser.add_argument("--matchups", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    failures = 0
+    for label, your_players, opp_players in matchups(rng, args.matchups):
+        start = time.perf_counter()
+        exact = FantasyNBASimulation.exact_win_probability(your_players, opp_players)
+        exact_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        mc = FantasyNBASimulation.estimate_win_probability(your_players, opp_players, sims=args.sims, rng=rng)
+        mc_time = time.perf_counter() - start
+
+        # 4 standard errors plus the grid's rounding allowance
+        tolerance = 4 * np.sqrt(max(mc["p_win"] * (1 - mc["p_win"]), 1e-4) / args.sims) + 0.002
+        ok = abs(exact["p_win"] - mc["p_win"]) <= tolerance
+        failures += not ok
+        print(f"{label:>20}: exact {exact['p_win']:.4f} ({exact_time * 1000:.1f} ms)  "
+              f"MC {mc['p_win']:.4f} ({mc_time * 1000:.0f} ms)  margin {exact['expected_margin']:+.2f} vs "
+              f"{mc['expected_margin']:+.2f}  {'ok' if ok else 'MISMATCH'}")
+
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,56 @@
+"""
+P(win) error against sims for each sampling strategy, measured against the exact engine.
+
+Run with: python -m benchmarks.sampling_convergence [--repeats 20]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from simulation.sampling import SAMPLING_METHODS, qmc
+from simulation.simulation import FantasyNBASimulation
+from benchmarks.lock_variance import YOUR_PLAYERS, OPP_PLAYERS
+
+SIM_COUNTS = (1024, 4096, 16384, 65536)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    # a fine grid makes the exact answer the reference
+    reference = FantasyNBASimulation.exact_win_probability(YOUR_PLAYERS, OPP_PLAYERS, step=0.02)["p_win"]
+    print(f"Exact P(win): {reference:.5f}   (RMSE over {args.repeats} runs, mean reported std error)")
+    methods = [m for m in SAMPLING_METHODS if m != "sobol" or qmc is not None]
+    print(f"{'sims':>8}" + "".join(f"{m:>30}" for m in methods))
+
+    rng = np.random.default_rng(args.seed)
+    rmse_by_method = {m: [] for m in methods}
+    for sims in SIM_COUNTS:
+        row = f"{sims:>8}"
+        for method in methods:
+            errors, reported = [], []
+            start = time.perf_counter()
+            for _ in range(args.repeats):
+                result = FantasyNBASimulation.estimate_win_probability(
+                    YOUR_PLAYERS, OPP_PLAYERS, sims=sims, batch_size=sims, rng=rng, sampling=method
+                )
+                errors.append(result["p_win"] - reference)
+                reported.append(result["std_error"])
+            elapsed = (time.perf_counter() - start) / args.repeats
+            rmse = float(np.sqrt(np.mean(np.square(errors))))
+            rmse_by_method[method].append(rmse)
+            row += f"{rmse:>12.5f} (se {np.mean(reported):.5f}, {elapsed * 1000:4.0f}ms)"
+        print(row)
+
+    if "random" in rmse_by_method:
+        base = np.array(rmse_by_method["random"])
+        for method in methods:
+            if method != "random":
+                ratio = (base / np.maximum(rmse_by_method[method], 1e-12)) ** 2
+                print(f"{method}: same accuracy as random with ~{np.median(ratio):.1f}x fewer sims (median over sim counts)")
+    if qmc is None:
+        print("sobol skipped: scipy is not installed")
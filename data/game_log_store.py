@@ -0,0 +1,275 @@
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import date
+
+import pandas as pd
+
+from api.nba_client import NBAApiClient
+from models.fantasy_data import FantasyData
+
+# Columns kept from the NBA game logs, in the order they are returned
+GAME_LOG_COLUMNS = [
+    "Player_ID", "Game_ID", "GAME_DATE", "MATCHUP", "WL", "MIN",
+    "FGM", "FGA", "FG3M", "FG3A", "FTM", "FTA", "OREB", "DREB", "REB",
+    "AST", "STL", "BLK", "TOV", "PF", "PTS", "PLUS_MINUS",
+]
+STAT_COLUMNS = GAME_LOG_COLUMNS[5:]
+
+# sync_state scope used for league-wide ingestion
+LEAGUE_SCOPE = "league"
+
+
+class GameLogStore:
+    """
+    On-disk SQLite store of NBA game logs keyed by (player id, season, game id).
+
+    Refreshing a player only requests games on or after the last stored game date, and a player
+    refreshed within REFRESH_INTERVAL seconds is served straight from disk.
+    """
+    DEFAULT_PATH = "data/game_logs.sqlite"
+    REFRESH_INTERVAL = 15 * 60
+
+    _write_lock = threading.Lock()
+
+    def __init__(self, path=DEFAULT_PATH, refresh_interval=REFRESH_INTERVAL):
+        self.path = path
+        self.refresh_interval = refresh_interval
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            stat_columns = ", ".join(f'"{c}" REAL' for c in STAT_COLUMNS)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS game_logs ("
+                " player_id INTEGER NOT NULL, season TEXT NOT NULL, game_id TEXT NOT NULL,"
+                " game_date TEXT NOT NULL, matchup TEXT, wl TEXT, "
+                f"{stat_columns}, PRIMARY KEY (player_id, season, game_id))"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS sync_state ("
+                " scope TEXT NOT NULL, season TEXT NOT NULL, refreshed_at REAL NOT NULL,"
+                " PRIMARY KEY (scope, season))"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS league_sync (season TEXT PRIMARY KEY, last_game_date TEXT NOT NULL)"
+            )
+
+    @contextmanager
+    def _connect(self):
+        # one connection per operation keeps the store usable from worker threads
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    # ---------------------------
+    # Reads
+    # ---------------------------
+    def get_game_log(self, player_id, season=None, refresh=True):
+        """
+        Return a player's stored game log (most recent game first), refreshing it first if stale.
+
+        Args:
+            player_id (int): NBA player id
+            season (str): Season like "2025-26", defaults to NBAApiClient.SEASON
+            refresh (bool): Fetch newer games from the NBA API when the stored log is stale
+
+        Returns:
+            pd.DataFrame: Game log with the GAME_LOG_COLUMNS columns
+        """
+        season = season or NBAApiClient.SEASON
+        if refresh:
+            self.refresh_player(player_id, season)
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT player_id, game_id, game_date, matchup, wl, "
+                + ", ".join(f'"{c}"' for c in STAT_COLUMNS)
+                + " FROM game_logs WHERE player_id = ? AND season = ? ORDER BY game_date DESC",
+                (int(player_id), season),
+            ).fetchall()
+        return pd.DataFrame(rows, columns=GAME_LOG_COLUMNS)
+
+    def last_game_date(self, player_id, season=None):
+        season = season or NBAApiClient.SEASON
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT MAX(game_date) FROM game_logs WHERE player_id = ? AND season = ?",
+                (int(player_id), season),
+            ).fetchone()
+        return date.fromisoformat(row[0]) if row and row[0] else None
+
+    def is_fresh(self, scope, season=None):
+        """True if scope (a player id or LEAGUE_SCOPE) was synced within the refresh interval."""
+        season = season or NBAApiClient.SEASON
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT refreshed_at FROM sync_state WHERE scope = ? AND season = ?",
+                (str(scope), season),
+            ).fetchone()
+        return row is not None and time.time() - row[0] < self.refresh_interval
+
+    # ---------------------------
+    # Writes
+    # ---------------------------
+    def refresh_player(self, player_id, season=None, force=False):
+        """
+        Fetch and append games newer than the last stored game for one player.
+
+        Returns:
+            int: Number of game rows written (0 when served from disk)
+        """
+        season = season or NBAApiClient.SEASON
+        # a fresh league-wide sync already covers every player
+        if not force and (self.is_fresh(player_id, season) or self.is_fresh(LEAGUE_SCOPE, season)):
+            return 0
+        # re-request the last stored day as well: upserts by game id make the overlap harmless
+        game_log = NBAApiClient.get_player_game_log(
+            player_id, season=season, date_from=self.last_game_date(player_id, season)
+        )
+        written = self.upsert_game_log(game_log, season, player_id=player_id)
+        self.mark_synced(player_id, season)
+        return written
+
+    def sync_league(self, season=None, date_to=None, force=False):
+        """
+        Pull every player's games since the last league-wide sync in one LeagueGameLog request.
+
+        The first sync covers the whole season so later per-player reads need no upstream call.
+
+        Returns:
+            int: Number of game rows written (0 when the last sync is still fresh)
+        """
+        season = season or NBAApiClient.SEASON
+        if not force and self.is_fresh(LEAGUE_SCOPE, season):
+            return 0
+        with self._connect() as conn:
+            row = conn.execute("SELECT last_game_date FROM league_sync WHERE season = ?", (season,)).fetchone()
+        date_from = date.fromisoformat(row[0]) if row else None
+        game_log = NBAApiClient.get_league_game_log(season=season, date_from=date_from, date_to=date_to)
+        return self.ingest_league_game_log(game_log, season)
+
+    def ingest_league_game_log(self, game_log, season=None):
+        """
+        Split a league-wide game log by player into the store and advance the league sync watermark.
+
+        Args:
+            game_log (pd.DataFrame): LeagueGameLog rows (PLAYER_ID, GAME_ID, GAME_DATE, ...)
+            season (str): Season the rows belong to
+
+        Returns:
+            int: Number of game rows written
+        """
+        season = season or NBAApiClient.SEASON
+        written = self.upsert_game_log(game_log, season)
+        if written:
+            last_game_date = pd.to_datetime(game_log["GAME_DATE"], format="mixed").max().strftime("%Y-%m-%d")
+            with self._write_lock, self._connect() as conn:
+                conn.execute(
+                    "INSERT INTO league_sync (season, last_game_date) VALUES (?, ?)"
+                    " ON CONFLICT(season) DO UPDATE SET last_game_date = MAX(last_game_date, excluded.last_game_date)",
+                    (season, last_game_date),
+                )
+        self.mark_synced(LEAGUE_SCOPE, season)
+        return written
+
+    def upsert_game_log(self, game_log, season=None, player_id=None):
+        """
+        Insert or replace game log rows. Rows are keyed by their own Player_ID/PLAYER_ID column,
+        or by player_id when the log has no player column.
+        """
+        season = season or NBAApiClient.SEASON
+        if game_log is None or len(game_log) == 0:
+            return 0
+        game_log = game_log.rename(columns={"PLAYER_ID": "Player_ID", "GAME_ID": "Game_ID"})
+        if "Player_ID" not in game_log:
+            game_log = game_log.assign(Player_ID=player_id)
+
+        # PlayerGameLog returns "OCT 22, 2025", LeagueGameLog "2025-10-22"
+        game_dates = pd.to_datetime(game_log["GAME_DATE"], format="mixed").dt.strftime("%Y-%m-%d")
+        stats = game_log.reindex(columns=STAT_COLUMNS)
+        if stats["MIN"].dtype == object:
+            stats = stats.assign(MIN=FantasyData.get_minutes(game_log))
+
+        empty = [None] * len(game_log)
+        rows = list(zip(
+            game_log["Player_ID"].astype(int).tolist(),
+            [season] * len(game_log),
+            game_log["Game_ID"].astype(str).tolist(),
+            game_dates.tolist(),
+            game_log["MATCHUP"].tolist() if "MATCHUP" in game_log else empty,
+            game_log["WL"].tolist() if "WL" in game_log else empty,
+            *[stats[c].astype(float).tolist() for c in STAT_COLUMNS],
+        ))
+        placeholders = ", ".join("?" * (6 + len(STAT_COLUMNS)))
+        with self._write_lock, self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO game_logs (player_id, season, game_id, game_date, matchup, wl, "
+                + ", ".join(f'"{c}"' for c in STAT_COLUMNS)
+                + f") VALUES ({placeholders})",
+                rows,
+            )
+        return len(rows)
+
+    def mark_synced(self, scope, season=None):
+        season = season or NBAApiClient.SEASON
+        with self._write_lock, self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO sync_state (scope, season, refreshed_at) VALUES (?, ?, ?)",
+                (str(scope), season, time.time()),
+            )
+
+
+# ---------------------------
+# Offline check: ingest a synthetic LeagueGameLog response into a throwaway store
+# ---------------------------
+if __name__ == "__main__":
+    import json
+    import sys
+    import tempfile
+
+    fixture = sys.argv[1] if len(sys.argv) > 1 else "data/json/fixtures/league_game_log_synthetic.json"
+    with open(fixture, "r", encoding="utf-8") as f:
+        league_log = NBAApiClient.game_log_from_response(json.load(f))
+    expected_counts = league_log.groupby("PLAYER_ID").size().to_dict()
+    game_dates = sorted(league_log["GAME_DATE"].unique())
+
+    def offline(*args, **kwargs):
+        raise AssertionError("upstream NBA API call during the offline check")
+
+    # every read below must be served from the store
+    NBAApiClient.get_player_game_log = staticmethod(offline)
+    NBAApiClient.get_league_game_log = staticmethod(offline)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = GameLogStore(os.path.join(tmp, "game_logs.sqlite"))
+
+        def watermark():
+            with store._connect() as conn:
+                row = conn.execute(
+                    "SELECT last_game_date FROM league_sync WHERE season = ?", (NBAApiClient.SEASON,)
+                ).fetchone()
+            return row[0] if row else None
+
+        # two incremental syncs: everything before the last date, then the last date
+        first = league_log[league_log["GAME_DATE"] < game_dates[-1]]
+        assert store.ingest_league_game_log(first) == len(first)
+        assert watermark() == game_dates[-2]
+        assert store.ingest_league_game_log(league_log) == len(league_log)
+        assert watermark() == game_dates[-1]
+        # an older batch never moves the watermark back
+        store.ingest_league_game_log(first)
+        assert watermark() == game_dates[-1]
+
+        for player_id, name in league_log.groupby("PLAYER_ID")["PLAYER_NAME"].first().items():
+            player_log = store.get_game_log(player_id)
+            # overlapping syncs upsert by game id, so each game is stored once
+            assert len(player_log) == expected_counts[player_id], (name, len(player_log))
+            assert player_log["GAME_DATE"].is_monotonic_decreasing
+            mean, std = FantasyData.get_fantasy_stats(player_log)
+            print(f"{name}: {len(player_log)} games, mean = {mean:.2f}, std = {std:.2f}")
+    print(f"Offline game log store check OK ({len(league_log)} rows from {fixture})")
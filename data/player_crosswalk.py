@@ -0,0 +1,186 @@
+import json
+import os
+import re
+import threading
+import unicodedata
+from collections import defaultdict
+
+from nba_api.stats.static import players
+
+SUFFIXES = {"jr", "sr", "ii", "iii", "iv", "v"}
+FUZZY_MIN_SIMILARITY = 0.6
+
+
+def normalize_name(name):
+    """
+    Normalize a player name for matching: strip accents, punctuation and generational suffixes.
+    "Nikola Jokić" -> "nikola jokic", "Jaren Jackson Jr." -> "jaren jackson", "C.J. McCollum" -> "cj mccollum"
+    """
+    name = unicodedata.normalize("NFKD", name or "")
+    name = "".join(c for c in name if not unicodedata.combining(c)).lower()
+    name = re.sub(r"[.'’]", "", name)
+    tokens = re.sub(r"[^a-z0-9]+", " ", name).split()
+    if len(tokens) > 2 and tokens[-1] in SUFFIXES:
+        tokens = tokens[:-1]
+    return " ".join(tokens)
+
+
+def trigrams(normalized):
+    padded = f"  {normalized} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class PlayerCrosswalk:
+    """
+    Sleeper player_id -> NBA PERSON_ID crosswalk plus O(1) name lookups.
+
+    The crosswalk is built once from players_complete_info.json and the nba_api static player
+    list, saved to CROSSWALK_PATH, and rebuilt only when the Sleeper dump is newer than it.
+    Names that don't match exactly after normalization fall back to a trigram similarity index,
+    restricted to active players with the same last name so a rookie is never mapped onto a
+    retired namesake. The saved crosswalk only holds exact matches; fuzzy hits are written to
+    FUZZY_MATCHES_PATH for review.
+    """
+    SLEEPER_PLAYERS_PATH = "data/json/players_complete_info.json"
+    CROSSWALK_PATH = "data/json/player_crosswalk.json"
+    FUZZY_MATCHES_PATH = "data/json/player_crosswalk_fuzzy.json"
+
+    _lock = threading.RLock()
+    _sleeper_to_nba = None
+    _name_index = None     # normalized name -> [nba ids], active players first
+    _trigram_index = None  # trigram -> {nba ids}
+    _trigram_counts = None  # nba id -> number of trigrams in its name
+    _active_last_names = None  # active nba id -> normalized last name
+
+    # ---------------------------
+    # Lookups
+    # ---------------------------
+    @staticmethod
+    def nba_id_for_sleeper_id(sleeper_id):
+        """NBA PERSON_ID for a Sleeper player_id, or None if the player has no NBA match."""
+        PlayerCrosswalk._ensure_crosswalk()
+        return PlayerCrosswalk._sleeper_to_nba.get(str(sleeper_id))
+
+    @staticmethod
+    def nba_id_for_name(name, fuzzy=True):
+        """NBA PERSON_ID for a player name: exact normalized match first, then (optionally) fuzzy."""
+        PlayerCrosswalk._ensure_name_index()
+        normalized = normalize_name(name)
+        candidates = PlayerCrosswalk._name_index.get(normalized)
+        if candidates:
+            return candidates[0]
+        return PlayerCrosswalk._fuzzy_match(normalized) if fuzzy else None
+
+    @staticmethod
+    def _fuzzy_match(normalized):
+        """
+        Trigram match among active players sharing the exact normalized last name (e.g. a
+        nickname or spelling variant of the first name); None when there is no such player.
+        """
+        query = trigrams(normalized)
+        if not normalized or not query:
+            return None
+        last_name = normalized.split()[-1]
+        shared = defaultdict(int)
+        for gram in query:
+            for nba_id in PlayerCrosswalk._trigram_index.get(gram, ()):
+                if PlayerCrosswalk._active_last_names.get(nba_id) == last_name:
+                    shared[nba_id] += 1
+        best_id, best_key = None, (FUZZY_MIN_SIMILARITY, 0)
+        for nba_id, count in shared.items():
+            score = count / (len(query) + PlayerCrosswalk._trigram_counts[nba_id] - count)
+            # equal scores go to the most recent id, as in the exact index
+            if (score, nba_id) > best_key:
+                best_id, best_key = nba_id, (score, nba_id)
+        return best_id
+
+    # ---------------------------
+    # Building
+    # ---------------------------
+    @staticmethod
+    def _ensure_name_index():
+        if PlayerCrosswalk._name_index is not None:
+            return
+        with PlayerCrosswalk._lock:
+            if PlayerCrosswalk._name_index is not None:
+                return
+            name_index = defaultdict(list)
+            trigram_index = defaultdict(set)
+            trigram_counts = {}
+            active_last_names = {}
+            # active players (then most recent ids) win ties on shared names
+            for player in sorted(players.get_players(), key=lambda p: (not p["is_active"], -p["id"])):
+                normalized = normalize_name(player["full_name"])
+                name_index[normalized].append(player["id"])
+                grams = trigrams(normalized)
+                trigram_counts[player["id"]] = len(grams)
+                if player["is_active"] and normalized:
+                    active_last_names[player["id"]] = normalized.split()[-1]
+                for gram in grams:
+                    trigram_index[gram].add(player["id"])
+            PlayerCrosswalk._trigram_counts = trigram_counts
+            PlayerCrosswalk._active_last_names = active_last_names
+            PlayerCrosswalk._trigram_index = dict(trigram_index)
+            PlayerCrosswalk._name_index = dict(name_index)
+
+    @staticmethod
+    def _ensure_crosswalk():
+        if PlayerCrosswalk._sleeper_to_nba is not None:
+            return
+        with PlayerCrosswalk._lock:
+            if PlayerCrosswalk._sleeper_to_nba is not None:
+                return
+            crosswalk_path = PlayerCrosswalk.CROSSWALK_PATH
+            sleeper_path = PlayerCrosswalk.SLEEPER_PLAYERS_PATH
+            if os.path.exists(crosswalk_path) and (
+                not os.path.exists(sleeper_path) or os.path.getmtime(crosswalk_path) >= os.path.getmtime(sleeper_path)
+            ):
+                with open(crosswalk_path, "r", encoding="utf-8") as f:
+                    PlayerCrosswalk._sleeper_to_nba = json.load(f)
+                return
+            PlayerCrosswalk.build()
+
+    @staticmethod
+    def build():
+        """
+        Rebuild the Sleeper -> NBA crosswalk from the Sleeper dump and save it.
+
+        Returns:
+            dict: Mapping Sleeper player_id -> NBA PERSON_ID
+        """
+        with PlayerCrosswalk._lock:
+            return PlayerCrosswalk._build()
+
+    @staticmethod
+    def _build():
+        PlayerCrosswalk._ensure_name_index()
+        with open(PlayerCrosswalk.SLEEPER_PLAYERS_PATH, "r", encoding="utf-8") as f:
+            sleeper_players = json.load(f)
+
+        crosswalk = {}
+        fuzzy_matches = {}
+        for sleeper_id, info in sleeper_players.items():
+            name = info.get("full_name") or f"{info.get('first_name', '')} {info.get('last_name', '')}"
+            nba_id = PlayerCrosswalk.nba_id_for_name(name, fuzzy=False)
+            if nba_id is not None:
+                crosswalk[sleeper_id] = nba_id
+                continue
+            # a guess is left unmapped (lookups fall back to the name) and kept for review
+            guess = PlayerCrosswalk._fuzzy_match(normalize_name(name))
+            if guess is not None:
+                fuzzy_matches[sleeper_id] = {"name": name.strip(), "nba_id": guess}
+
+        for path, data in ((PlayerCrosswalk.CROSSWALK_PATH, crosswalk),
+                           (PlayerCrosswalk.FUZZY_MATCHES_PATH, fuzzy_matches)):
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=0, sort_keys=True, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        PlayerCrosswalk._sleeper_to_nba = crosswalk
+        return crosswalk
+
+
+if __name__ == "__main__":
+    crosswalk = PlayerCrosswalk.build()
+    print(f"Mapped {len(crosswalk)} Sleeper players to NBA ids, saved to {PlayerCrosswalk.CROSSWALK_PATH}")
+    print(f"Unconfirmed fuzzy matches for review: {PlayerCrosswalk.FUZZY_MATCHES_PATH}")
@@ -0,0 +1,44 @@
+import json
+import os
+import threading
+from types import MappingProxyType
+
+
+class PlayerDirectory:
+    """
+    Process-wide, read-only Sleeper player_id -> name directory backed by nba_players.json.
+
+    The file is parsed on first use and again only when its mtime changes, so the CLI scripts
+    and the Streamlit app share one parsed copy instead of re-reading it per lookup.
+    """
+    PATH = "data/json/nba_players.json"
+    UNKNOWN = "Unknown Player"
+
+    _lock = threading.Lock()
+    _names = MappingProxyType({})
+    _mtime = None
+
+    @staticmethod
+    def all():
+        """Read-only mapping of every Sleeper player_id to its name."""
+        try:
+            mtime = os.stat(PlayerDirectory.PATH).st_mtime_ns
+        except FileNotFoundError:
+            return PlayerDirectory._names
+        if mtime != PlayerDirectory._mtime:
+            with PlayerDirectory._lock:
+                if mtime != PlayerDirectory._mtime:
+                    with open(PlayerDirectory.PATH, "r", encoding="utf-8") as f:
+                        PlayerDirectory._names = MappingProxyType(json.load(f))
+                    PlayerDirectory._mtime = mtime
+        return PlayerDirectory._names
+
+    @staticmethod
+    def name_for(sleeper_id, default=UNKNOWN):
+        return PlayerDirectory.all().get(str(sleeper_id), default)
+
+    @staticmethod
+    def names_for(sleeper_ids, default=UNKNOWN):
+        """Names for many ids with a single freshness check."""
+        names = PlayerDirectory.all()
+        return [names.get(str(sleeper_id), default) for sleeper_id in sleeper_ids]
@@ -0,0 +1,214 @@
+import json
+import os
+import struct
+import threading
+
+import numpy as np
+
+# Fantasy positions packed into one byte per player
+POSITION_BITS = {"PG": 1, "SG": 2, "SF": 4, "PF": 8, "C": 16, "DEF": 32}
+# Roster slot -> positions that can fill it (BN is handled separately: anyone can sit)
+SLOT_MASKS = {
+    "PG": POSITION_BITS["PG"],
+    "SG": POSITION_BITS["SG"],
+    "SF": POSITION_BITS["SF"],
+    "PF": POSITION_BITS["PF"],
+    "C": POSITION_BITS["C"],
+    "G": POSITION_BITS["PG"] | POSITION_BITS["SG"],
+    "F": POSITION_BITS["SF"] | POSITION_BITS["PF"],
+    "UTIL": 0xFF,
+}
+
+# String fields are indexes into an interned string pool, -1 meaning null
+RECORD_DTYPE = np.dtype([
+    ("player_id", "<i4"),
+    ("full_name", "<i4"),
+    ("first_name", "<i4"),
+    ("last_name", "<i4"),
+    ("team", "<i4"),
+    ("injury_status", "<i4"),
+    ("active", "u1"),
+    ("positions", "u1"),
+])
+STRING_FIELDS = ("full_name", "first_name", "last_name", "team", "injury_status")
+
+MAGIC = b"NBAPLYR1"
+ALIGNMENT = 8
+
+
+def positions_to_mask(fantasy_positions):
+    mask = 0
+    for position in fantasy_positions or ():
+        mask |= POSITION_BITS.get(position, 0)
+    return mask
+
+
+def mask_to_positions(mask):
+    return [position for position, bit in POSITION_BITS.items() if mask & bit]
+
+
+class PlayerMetadataStore:
+    """
+    Read-only, memory-mapped column store of the Sleeper player fields the app uses.
+
+    One file holds fixed-width records, a string offset table and an interned UTF-8 string pool.
+    Opening it maps the file instead of parsing JSON, so every Streamlit process shares the same
+    pages. get() returns the same keys as players_complete_info.json for the stored fields.
+
+    File layout: MAGIC | uint32 header length | JSON header | records | string offsets | string blob
+    """
+    SOURCE_PATH = "data/json/players_complete_info.json"
+    STORE_PATH = "data/players.bin"
+
+    _lock = threading.Lock()
+
+    def __init__(self, path):
+        self.path = path
+        raw = np.memmap(path, dtype=np.uint8, mode="r")
+        if bytes(raw[:len(MAGIC)]) != MAGIC:
+            raise ValueError(f"{path} is not a player metadata store")
+        (header_len,) = struct.unpack_from("<I", raw, len(MAGIC))
+        header_start = len(MAGIC) + 4
+        header = json.loads(bytes(raw[header_start:header_start + header_len]))
+
+        def section(name, dtype, count):
+            start = header[f"{name}_offset"]
+            return raw[start:start + count * np.dtype(dtype).itemsize].view(dtype)
+
+        self.records = section("records", RECORD_DTYPE, header["count"])
+        self._offsets = section("offsets", "<i8", header["strings"] + 1)
+        self._blob = section("blob", np.uint8, header["blob_size"])
+        # the id -> row index is the only thing built per process
+        blob = self._blob.tobytes()
+        offsets = self._offsets.tolist()
+        self._rows = {
+            blob[offsets[index]:offsets[index + 1]].decode("utf-8"): row
+            for row, index in enumerate(self.records["player_id"].tolist())
+        }
+
+    # ---------------------------
+    # Building
+    # ---------------------------
+    @staticmethod
+    def build(players=None, source_path=SOURCE_PATH, store_path=STORE_PATH):
+        """
+        Compact the Sleeper players dump (dict or JSON file) into store_path.
+
+        Returns:
+            PlayerMetadataStore: The freshly built store
+        """
+        if players is None:
+            with open(source_path, "r", encoding="utf-8") as f:
+                players = json.load(f)
+
+        pool, interned = [], {}
+
+        def intern(value):
+            if value is None:
+                return -1
+            value = str(value)
+            if value not in interned:
+                interned[value] = len(pool)
+                pool.append(value)
+            return interned[value]
+
+        records = np.zeros(len(players), dtype=RECORD_DTYPE)
+        for row, (player_id, info) in enumerate(players.items()):
+            records[row] = (
+                intern(player_id),
+                *(intern(info.get(field)) for field in STRING_FIELDS),
+                bool(info.get("active")),
+                positions_to_mask(info.get("fantasy_positions")),
+            )
+
+        encoded = [value.encode("utf-8") for value in pool]
+        offsets = np.zeros(len(encoded) + 1, dtype="<i8")
+        offsets[1:] = np.cumsum([len(value) for value in encoded])
+        blob = b"".join(encoded)
+
+        def pad(size):
+            return -size % ALIGNMENT
+
+        # header offsets depend on the header length, so size it with placeholder offsets first
+        header = {"count": len(records), "strings": len(pool), "blob_size": len(blob),
+                  "records_offset": 0, "offsets_offset": 0, "blob_offset": 0}
+        header_len = len(json.dumps(header).encode("utf-8")) + 64
+        position = len(MAGIC) + 4 + header_len
+        position += pad(position)
+        header["records_offset"] = position
+        position += records.nbytes + pad(records.nbytes)
+        header["offsets_offset"] = position
+        position += offsets.nbytes
+        header["blob_offset"] = position
+        header_bytes = json.dumps(header).encode("utf-8").ljust(header_len)
+
+        directory = os.path.dirname(store_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{store_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(MAGIC + struct.pack("<I", header_len) + header_bytes)
+            f.write(b"\0" * (header["records_offset"] - f.tell()))
+            f.write(records.tobytes())
+            f.write(b"\0" * (header["offsets_offset"] - f.tell()))
+            f.write(offsets.tobytes())
+            f.write(blob)
+        # readers that already mapped the old file keep their (unlinked) copy
+        os.replace(tmp_path, store_path)
+        return PlayerMetadataStore(store_path)
+
+    @staticmethod
+    def open(source_path=SOURCE_PATH, store_path=STORE_PATH):
+        """Open the store, (re)building it first if the Sleeper dump is newer or it doesn't exist."""
+        with PlayerMetadataStore._lock:
+            if not os.path.exists(source_path):
+                if os.path.exists(store_path):
+                    return PlayerMetadataStore(store_path)
+                return PlayerMetadataStore.build({}, store_path=store_path)
+            if not os.path.exists(store_path) or os.path.getmtime(store_path) < os.path.getmtime(source_path):
+                return PlayerMetadataStore.build(source_path=source_path, store_path=store_path)
+            return PlayerMetadataStore(store_path)
+
+    # ---------------------------
+    # Lookups
+    # ---------------------------
+    def string(self, index):
+        if index < 0:
+            return None
+        return bytes(self._blob[self._offsets[index]:self._offsets[index + 1]]).decode("utf-8")
+
+    def positions_mask(self, player_id):
+        row = self._rows.get(str(player_id))
+        return 0 if row is None else int(self.records["positions"][row])
+
+    def can_fill(self, player_id, position):
+        """Roster slot eligibility from the position bitmask."""
+        if position == "BN":
+            return True
+        return bool(self.positions_mask(player_id) & SLOT_MASKS.get(position, POSITION_BITS.get(position, 0)))
+
+    def get(self, player_id, default=None):
+        row = self._rows.get(str(player_id))
+        if row is None:
+            return default
+        record = self.records[row]
+        info = {field: self.string(int(record[field])) for field in STRING_FIELDS}
+        info["active"] = bool(record["active"])
+        info["fantasy_positions"] = mask_to_positions(int(record["positions"]))
+        return info
+
+    def __contains__(self, player_id):
+        return str(player_id) in self._rows
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __iter__(self):
+        return iter(self._rows)
+
+
+if __name__ == "__main__":
+    store = PlayerMetadataStore.build()
+    size = os.path.getsize(PlayerMetadataStore.STORE_PATH)
+    source_size = os.path.getsize(PlayerMetadataStore.SOURCE_PATH)
+    print(f"Stored {len(store)} players in {PlayerMetadataStore.STORE_PATH}: {size:,} bytes (JSON: {source_size:,} bytes)")
@@ -0,0 +1,191 @@
+import codecs
+import hashlib
+import json
+import os
+
+from api.sleeper_api import SleeperAPI
+from data.player_store import PlayerMetadataStore, STRING_FIELDS
+
+COMPLETE_INFO_PATH = "data/json/players_complete_info.json"
+NAMES_PATH = "data/json/nba_players.json"
+# per-player content hashes plus the validators of the last download
+MANIFEST_PATH = "data/json/players_manifest.json"
+
+CHUNK_SIZE = 64 * 1024
+
+
+def iter_json_object(chunks):
+    """
+    Incrementally parse a top-level JSON object, yielding (key, value) pairs.
+
+    Only one value plus one network chunk is held in memory at a time, so the multi-MB
+    /players/nba payload is never materialized as a whole.
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    chunks = iter(chunks)
+    buffer, pos, exhausted = "", 0, False
+
+    def fill():
+        nonlocal buffer, pos, exhausted
+        chunk = next(chunks, None)
+        if chunk is None:
+            exhausted = True
+            buffer = buffer[pos:] + text_decoder.decode(b"", final=True)
+        else:
+            buffer = buffer[pos:] + (text_decoder.decode(chunk) if isinstance(chunk, bytes) else chunk)
+        pos = 0
+
+    def skip_whitespace():
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in " \t\r\n":
+                pos += 1
+            if pos < len(buffer) or exhausted:
+                return
+            fill()
+
+    def decode_next():
+        # a decode is only trusted once something follows it, so numbers/literals can't be cut short
+        nonlocal pos
+        while True:
+            try:
+                value, end = decoder.raw_decode(buffer, pos)
+                if end < len(buffer) or exhausted:
+                    pos = end
+                    return value
+            except json.JSONDecodeError:
+                if exhausted:
+                    raise
+            fill()
+
+    def expect(characters):
+        nonlocal pos
+        skip_whitespace()
+        if pos >= len(buffer) or buffer[pos] not in characters:
+            raise ValueError(f"Expected one of {characters!r} in players payload")
+        pos += 1
+        return buffer[pos - 1]
+
+    expect("{")
+    skip_whitespace()
+    if pos < len(buffer) and buffer[pos] == "}":
+        return
+    while True:
+        skip_whitespace()
+        key = decode_next()
+        expect(":")
+        skip_whitespace()
+        yield key, decode_next()
+        if expect(",}") == "}":
+            return
+
+
+def content_hash(record):
+    return hashlib.sha1(json.dumps(record, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+def _load_manifest(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {"hashes": {}}
+
+
+def _write_atomic_json(path, payload):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def refresh_players(chunks=None, complete_info_path=COMPLETE_INFO_PATH, names_path=NAMES_PATH,
+                    manifest_path=MANIFEST_PATH, store_path=PlayerMetadataStore.STORE_PATH, force=False):
+    """
+    Stream the Sleeper players dump once and write players_complete_info.json, nba_players.json
+    and the compact player store from that single pass.
+
+    Every record is hashed; when no record was added, changed or removed the existing files are
+    left untouched. Otherwise all outputs are written to temp files and swapped in with os.replace.
+
+    Args:
+        chunks (iterable): Raw payload chunks (bytes/str). Defaults to streaming /players/nba,
+            revalidated with the ETag / Last-Modified of the previous download.
+        force (bool): Rewrite the files even if nothing changed
+
+    Returns:
+        dict: {"players", "added", "changed", "removed", "written"}
+    """
+    manifest = _load_manifest(manifest_path)
+    old_hashes = manifest.get("hashes", {})
+    validators = {}
+    if chunks is None:
+        headers = {}
+        outputs_exist = os.path.exists(complete_info_path) and os.path.exists(names_path)
+        if not force and outputs_exist and manifest.get("etag"):
+            headers["If-None-Match"] = manifest["etag"]
+        if not force and outputs_exist and manifest.get("last_modified"):
+            headers["If-Modified-Since"] = manifest["last_modified"]
+        response = SleeperAPI.stream_players(headers=headers)
+        if response.status_code == 304:
+            response.close()
+            return {"players": len(old_hashes), "added": 0, "changed": 0, "removed": 0, "written": False}
+        response.raise_for_status()
+        validators = {"etag": response.headers.get("ETag"), "last_modified": response.headers.get("Last-Modified")}
+        chunks = response.iter_content(chunk_size=CHUNK_SIZE)
+
+    complete_tmp = f"{complete_info_path}.tmp"
+    names_tmp = f"{names_path}.tmp"
+    hashes, compact, added, changed = {}, {}, 0, 0
+    try:
+        with open(complete_tmp, "w", encoding="utf-8") as complete_file, \
+                open(names_tmp, "w", encoding="utf-8") as names_file:
+            complete_file.write("{")
+            names_file.write("{")
+            names_written = 0
+            for player_id, info in iter_json_object(chunks):
+                separator = "," if hashes else ""
+                complete_file.write(f"{separator}\n{json.dumps(player_id)}: {json.dumps(info, ensure_ascii=False)}")
+
+                # same mapping data/nba_sleeper_to_name.py always produced
+                if info.get("first_name") or info.get("last_name"):
+                    name = f"{info.get('first_name', '')} {info.get('last_name', '')}".strip()
+                    names_file.write(f"{',' if names_written else ''}\n{json.dumps(player_id)}: {json.dumps(name, ensure_ascii=False)}")
+                    names_written += 1
+
+                compact[player_id] = {
+                    **{field: info.get(field) for field in STRING_FIELDS},
+                    "active": info.get("active"),
+                    "fantasy_positions": info.get("fantasy_positions"),
+                }
+                digest = content_hash(info)
+                previous = old_hashes.get(player_id)
+                if previous is None:
+                    added += 1
+                elif previous != digest:
+                    changed += 1
+                hashes[player_id] = digest
+            complete_file.write("\n}\n")
+            names_file.write("\n}\n")
+
+        removed = len(set(old_hashes) - set(hashes))
+        outputs_exist = os.path.exists(complete_info_path) and os.path.exists(names_path)
+        written = force or not outputs_exist or bool(added or changed or removed)
+        if written:
+            os.replace(complete_tmp, complete_info_path)
+            os.replace(names_tmp, names_path)
+            PlayerMetadataStore.build(compact, store_path=store_path)
+        _write_atomic_json(manifest_path, {**validators, "hashes": hashes})
+    finally:
+        for tmp_path in (complete_tmp, names_tmp):
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    return {"players": len(hashes), "added": added, "changed": changed, "removed": removed, "written": written}
+
+
+if __name__ == "__main__":
+    summary = refresh_players()
+    print(f"{summary['players']} players: {summary['added']} added, {summary['changed']} changed, "
+          f"{summary['removed']} removed ({'files rewritten' if summary['written'] else 'files unchanged'})")
@@ -41,6 +41,7 @@ def main():
 
 
     matchups = SleeperAPI.get_week_matchups(league_id, week)
+    scoring_settings = SleeperAPI.get_league_info(league_id).get('scoring_settings')
 
     user_matchup_data, opp_matchup_data = get_my_team_and_opponent_team(roster_id, matchups)
 
@@ -48,8 +49,8 @@ def main():
     my_player_names = get_player_names_from_team_data(user_matchup_data)
     opponent_player_names = get_player_names_from_team_data(opp_matchup_data)
 
-    my_team_fantasy_stats = player_names_to_fantasy_stats(my_player_names)
-    opponent_team_fantasy_stats = player_names_to_fantasy_stats(opponent_player_names)
+    my_team_fantasy_stats = player_names_to_fantasy_stats(my_player_names, scoring_settings)
+    opponent_team_fantasy_stats = player_names_to_fantasy_stats(opponent_player_names, scoring_settings)
 
     print("My Team Fantasy Stats:")
     for name, stats in my_team_fantasy_stats.items():
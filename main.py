@@ -152,14 +152,31 @@ def main():
                 json.dump(week_data, f, indent=2)
             print(f"Updated data saved to {filename}")
 
-    baseline = FantasyNBASimulation.estimate_win_probability(your_players, opp_players, sims=10000)
-    print(f"\nBaseline P(win) (no locks applied): {baseline['p_win']:.3f}, expected margin {baseline['expected_margin']:.2f}")
+    baseline = FantasyNBASimulation.estimate_win_probability(your_players, opp_players, target_precision=0.005)
+    print(f"\nBaseline P(win) (no locks applied): {baseline['p_win']:.3f} "
+          f"(95% CI {baseline['ci'][0]:.3f}-{baseline['ci'][1]:.3f}, {baseline['sims_used']:,} sims, seed {baseline['seed']}), "
+          f"expected margin {baseline['expected_margin']:.2f}")
 
-    rec = FantasyNBASimulation.recommend_best_lock(your_players, opp_players, sims=10000, min_delta=0.002)
+    rec = FantasyNBASimulation.recommend_best_lock(your_players, opp_players, min_delta=0.002, target_precision=0.005)
     print("\nEvaluations (top few):")
     for e in rec.get("evaluations", [])[:5]:
         print(e)
     print("Top recommendation:", rec.get("top_recommendation"))
 
+    lock_table = FantasyNBASimulation.lock_thresholds(your_players, opp_players)
+    print(f"\nBreak-even lock scores ({lock_table['sims_used']:,} sims, seed {lock_table['seed']}):")
+    for idx, entry in lock_table["players"].items():
+        live_score = your_players[idx].get("current_live_score")
+        decision = "" if live_score is None else f" | live {live_score:.1f}: {'lock' if live_score > entry['break_even'] else 'wait'}"
+        print(f"  {entry['player_name']}: lock above {entry['break_even']:.1f}{decision}")
+
+    lock_policy = FantasyNBASimulation.optimal_lock_policy(your_players, opp_players)
+    print("\nOptimal lock thresholds (lock a game's score at or above the threshold; unlocked scores are "
+          "dropped and the last game is kept, unlike the best-remaining-game model above):")
+    for p in lock_policy["players"]:
+        thresholds = ", ".join("never" if t is None else f"{t:.1f}" for t in p["thresholds"])
+        now = "" if p["lock_now"] is None else f" | lock now: {'yes' if p['lock_now'] else 'no'}"
+        print(f"  {p['player_name']}: [{thresholds}] | P(win) lock-or-drop {p['p_win_if_wait']:.3f}{now}")
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -20,7 +20,50 @@ Turnovers = -1 point
 """
 import numpy as np
 
+# Sleeper scoring_settings keys (as returned by SleeperAPI.get_league_info) -> game log columns
+STAT_COLUMNS = {
+    "pts": "PTS",
+    "reb": "REB",
+    "ast": "AST",
+    "stl": "STL",
+    "blk": "BLK",
+    "to": "TOV",
+    "tpm": "FG3M",
+    "tpa": "FG3A",
+    "fgm": "FGM",
+    "fga": "FGA",
+    "ftm": "FTM",
+    "fta": "FTA",
+    "oreb": "OREB",
+    "dreb": "DREB",
+    "pf": "PF",
+}
+
+# Stats that count towards double-doubles / triple-doubles
+DOUBLE_DIGIT_COLUMNS = ("PTS", "REB", "AST", "STL", "BLK")
+
+# Standard sleeper scoring (see table above). tf/ff are not in the NBA game logs, so they never score.
+DEFAULT_SCORING_SETTINGS = {
+    "pts": 0.5,
+    "reb": 1.0,
+    "ast": 1.0,
+    "stl": 2.0,
+    "blk": 2.0,
+    "tpm": 0.5,
+    "to": -1.0,
+    "dd": 1.0,
+    "td": 2.0,
+    "bonus_pt_40p": 2.0,
+    "bonus_pt_50p": 2.0,
+    "tf": -2.0,
+    "ff": -2.0,
+}
+
+
 class FantasyData:
+    # games with fewer minutes than this are treated as garbage time / injury exits and ignored
+    MIN_MINUTES = 15
+
     @staticmethod
     def calculate_fantasy_points(game_stats):
         if game_stats["MIN"] < 15:
@@ -37,20 +80,161 @@ class FantasyData:
         fourty_plus_bonus = 1 if points >= 40 else 0
         fifty_plus_bonus = 1 if points >= 50 else 0
 
-        fantasy_points = (points * 0.5) + (rebounds * 1) + (assists * 1) + (steals * 2)
-        + (blocks * 2) + (three_pointers * 0.5) - (turnovers * 1) + (double_double * 1)
-        + (triple_double * 2) + (fourty_plus_bonus * 2) + (fifty_plus_bonus * 2)
+        fantasy_points = ((points * 0.5) + (rebounds * 1) + (assists * 1) + (steals * 2)
+                          + (blocks * 2) + (three_pointers * 0.5) - (turnovers * 1) + (double_double * 1)
+                          + (triple_double * 2) + (fourty_plus_bonus * 2) + (fifty_plus_bonus * 2))
+        return fantasy_points
+
+    @staticmethod
+    def get_minutes(game_log):
+        """
+        Minutes played per row as floats. Handles both numeric MIN columns and "MM:SS" strings.
+        """
+        minutes = game_log["MIN"]
+        if minutes.dtype != object:
+            return minutes.to_numpy(dtype=float)
+        parts = minutes.fillna("0").astype(str).str.split(":", n=1, expand=True)
+        whole = parts[0].astype(float).to_numpy()
+        if parts.shape[1] > 1:
+            whole = whole + parts[1].fillna("0").astype(float).to_numpy() / 60.0
+        return whole
+
+    @staticmethod
+    def score_game_log(game_log, scoring_settings=None):
+        """
+        Score every game in a game log in one vectorized pass.
+
+        Args:
+            game_log (pd.DataFrame): NBA game log rows (one or many players)
+            scoring_settings (dict): League scoring_settings from SleeperAPI.get_league_info.
+                Defaults to standard sleeper scoring.
+
+        Returns:
+            np.ndarray: Fantasy points per row, NaN for games under MIN_MINUTES
+        """
+        settings = DEFAULT_SCORING_SETTINGS if scoring_settings is None else scoring_settings
+        num_games = len(game_log)
+
+        def column(name):
+            if name not in game_log:
+                return np.zeros(num_games)
+            return game_log[name].to_numpy(dtype=float)
+
+        fantasy_points = np.zeros(num_games)
+        for key, column_name in STAT_COLUMNS.items():
+            weight = settings.get(key)
+            if weight:
+                fantasy_points += weight * column(column_name)
+
+        # missed shots are scored by some leagues
+        if settings.get("fgmi"):
+            fantasy_points += settings["fgmi"] * (column("FGA") - column("FGM"))
+        if settings.get("ftmi"):
+            fantasy_points += settings["ftmi"] * (column("FTA") - column("FTM"))
+
+        points = column("PTS")
+        double_digits = (np.stack([column(c) for c in DOUBLE_DIGIT_COLUMNS]) >= 10).sum(axis=0)
+        fantasy_points += settings.get("dd", 0) * (double_digits >= 2)
+        fantasy_points += settings.get("td", 0) * (double_digits >= 3)
+        fantasy_points += settings.get("bonus_pt_40p", 0) * (points >= 40)
+        fantasy_points += settings.get("bonus_pt_50p", 0) * (points >= 50)
+
+        if num_games:
+            fantasy_points[FantasyData.get_minutes(game_log) < FantasyData.MIN_MINUTES] = np.nan
         return fantasy_points
-    
+
+    @staticmethod
+    def counted_games(fantasy_points):
+        """
+        Games that enter a player's mean/std: long enough to be scored and not negative.
+        Negative games (e.g. turnover-heavy ones) have always been left out of the stats.
+        """
+        with np.errstate(invalid="ignore"):
+            return fantasy_points >= 0
+
     @staticmethod
-    def get_fantasy_stats(player_game_log):
-        fantasy_points_list = []
-        for _, game in player_game_log.iterrows():
-            fantasy_points = FantasyData.calculate_fantasy_points(game)
-            if fantasy_points >= 0:
-                fantasy_points_list.append(fantasy_points)
+    def get_fantasy_stats(player_game_log, scoring_settings=None):
+        fantasy_points = FantasyData.score_game_log(player_game_log, scoring_settings)
+        fantasy_points_list = fantasy_points[FantasyData.counted_games(fantasy_points)]
 
         mean_fantasy_points = np.mean(fantasy_points_list)
         stddev_fantasy_points = np.std(fantasy_points_list)
 
-        return mean_fantasy_points, stddev_fantasy_points
\ No newline at end of file
+        return mean_fantasy_points, stddev_fantasy_points
+
+    @staticmethod
+    def get_fantasy_stats_by_player(game_logs, scoring_settings=None, player_column="Player_ID"):
+        """
+        Fantasy stats for many players' game logs concatenated into one DataFrame.
+
+        Args:
+            game_logs (pd.DataFrame): Game log rows for any number of players
+            scoring_settings (dict): League scoring_settings, defaults to standard sleeper scoring
+            player_column (str): Column identifying the player of each row
+
+        Returns:
+            dict: Mapping player id -> (mean, std, games_played)
+        """
+        if len(game_logs) == 0:
+            return {}
+        fantasy_points = FantasyData.score_game_log(game_logs, scoring_settings)
+        player_ids, inverse = np.unique(game_logs[player_column].to_numpy(), return_inverse=True)
+        num_players = len(player_ids)
+
+        valid = FantasyData.counted_games(fantasy_points)
+        groups = inverse[valid]
+        scores = fantasy_points[valid]
+        counts = np.bincount(groups, minlength=num_players)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = np.bincount(groups, weights=scores, minlength=num_players) / counts
+            deviations = scores - means[groups]
+            stds = np.sqrt(np.bincount(groups, weights=deviations ** 2, minlength=num_players) / counts)
+        games_played = np.bincount(inverse, minlength=num_players)
+
+        return {
+            player_id: (means[i], stds[i], int(games_played[i]))
+            for i, player_id in enumerate(player_ids.tolist())
+        }
+
+
+# ---------------------------
+# Parity check: vectorized scoring vs the per-row reference
+# ---------------------------
+if __name__ == "__main__":
+    import pandas as pd
+
+    rng = np.random.default_rng(0)
+    num_rows = 5000
+    sample_log = pd.DataFrame({
+        "Player_ID": rng.integers(0, 40, num_rows),
+        "MIN": rng.integers(0, 45, num_rows),
+        "PTS": rng.integers(0, 60, num_rows),
+        "REB": rng.integers(0, 20, num_rows),
+        "AST": rng.integers(0, 16, num_rows),
+        "STL": rng.integers(0, 11, num_rows),
+        "BLK": rng.integers(0, 11, num_rows),
+        "FG3M": rng.integers(0, 10, num_rows),
+        "TOV": rng.integers(0, 8, num_rows),
+    })
+
+    # turnover-only games: negative scores, including a real -1.0
+    sample_log.loc[:49, ["PTS", "REB", "AST", "STL", "BLK", "FG3M"]] = 0
+    sample_log.loc[:49, "MIN"] = 20
+    sample_log.loc[:49, "TOV"] = np.arange(50) % 4 + 1
+
+    reference = np.array([FantasyData.calculate_fantasy_points(game) for _, game in sample_log.iterrows()])
+    vectorized = FantasyData.score_game_log(sample_log)
+    # validity comes from minutes: -1 is also a real score for a long enough game
+    reference_valid = FantasyData.get_minutes(sample_log) >= FantasyData.MIN_MINUTES
+    assert np.array_equal(reference_valid, ~np.isnan(vectorized))
+    assert np.allclose(reference[reference_valid], vectorized[reference_valid])
+    # the stats keep the baseline's filter: only scored games with fantasy_points >= 0
+    assert np.array_equal(FantasyData.counted_games(vectorized), reference_valid & (reference >= 0))
+    assert (reference_valid & (reference < 0)).any()
+
+    by_player = FantasyData.get_fantasy_stats_by_player(sample_log)
+    for player_id, player_log in sample_log.groupby("Player_ID"):
+        mean, std = FantasyData.get_fantasy_stats(player_log)
+        assert np.isclose(by_player[player_id][0], mean) and np.isclose(by_player[player_id][1], std)
+        assert by_player[player_id][2] == len(player_log)
+    print(f"Scoring parity OK on {num_rows} games / {len(by_player)} players")
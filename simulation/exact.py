@@ -0,0 +1,119 @@
+import math
+from functools import lru_cache
+
+import numpy as np
+
+from simulation.team import Team
+
+# Grid spacing (fantasy points) shared by every player and team distribution
+DEFAULT_STEP = 0.1
+# Upper end of a player's grid, in standard deviations above the mean; the rest of the tail
+# is folded into the last bin
+TAIL_SIGMAS = 8.0
+
+_erfc = np.frompyfunc(math.erfc, 1, 1)
+
+
+def normal_cdf(x):
+    """Standard normal CDF for an array (scipy-free)."""
+    return 0.5 * _erfc(-np.asarray(x, dtype=float) / math.sqrt(2.0)).astype(float)
+
+
+# ---------------------------
+# Distributions on the grid
+# ---------------------------
+# A distribution is (offset, pmf): pmf[k] is the probability of (offset + k) * step points.
+def point_mass(value, step=DEFAULT_STEP):
+    # split between the two neighbouring grid points so the mean is exact
+    position = value / step
+    lower = int(math.floor(position))
+    fraction = position - lower
+    if fraction == 0:
+        return lower, np.ones(1)
+    return lower, np.array([1.0 - fraction, fraction])
+
+
+# A player's week is W = max(0, max_j X_j) with X_j ~ N(mu, sigma^2) over G games, so
+#   P(W <= x) = Phi((x - mu) / sigma) ** G  for x >= 0 (0 below), with a point mass at 0.
+# Each grid point k collects the probability of rounding to it: F((k + 1/2) h) - F((k - 1/2) h).
+def player_distribution(mean, std, games_left, locked=None, step=DEFAULT_STEP):
+    if locked is not None and not np.isnan(locked):
+        return point_mass(float(locked), step)
+    std = abs(std)
+    if games_left <= 0:
+        return 0, np.ones(1)
+    if std == 0:
+        return point_mass(max(float(mean), 0.0), step)
+
+    last = max(int(math.ceil((mean + TAIL_SIGMAS * std) / step)), 1)
+    upper_edges = (np.arange(last) + 0.5) * step
+    cdf = normal_cdf((upper_edges - mean) / std) ** games_left
+    pmf = np.diff(np.concatenate(([0.0], cdf, [1.0])))
+    return 0, np.clip(pmf, 0, None)
+
+
+@lru_cache(maxsize=4096)
+def cached_player_distribution(mean, std, games_left, locked=None, step=DEFAULT_STEP):
+    """player_distribution memoized on its (hashable) arguments; the pmf is read-only."""
+    offset, pmf = player_distribution(mean, std, games_left, locked=locked, step=step)
+    pmf.setflags(write=False)
+    return offset, pmf
+
+
+def convolve(distributions):
+    """Distribution of the sum of independent grid distributions, via one FFT product."""
+    distributions = list(distributions)
+    if not distributions:
+        return 0, np.ones(1)
+    offset = sum(o for o, _ in distributions)
+    length = sum(len(pmf) for _, pmf in distributions) - len(distributions) + 1
+    size = 1 << (length - 1).bit_length()
+    spectrum = np.ones(size // 2 + 1, dtype=complex)
+    for _, pmf in distributions:
+        spectrum *= np.fft.rfft(pmf, size)
+    pmf = np.clip(np.fft.irfft(spectrum, size)[:length], 0, None)
+    return offset, pmf / pmf.sum()
+
+
+def team_distribution(players, step=DEFAULT_STEP):
+    team = Team.from_players(players)
+    return convolve(
+        cached_player_distribution(
+            float(row["mean"]), float(row["std"]), int(row["games_left"]),
+            None if np.isnan(row["locked"]) else float(row["locked"]), step=step
+        )
+        for row in team.data
+    )
+
+
+def difference(first, second):
+    """Distribution of first - second (negating a distribution reverses its pmf)."""
+    second_offset, second_pmf = second
+    return convolve([first, (-(second_offset + len(second_pmf) - 1), second_pmf[::-1])])
+
+
+def margin_distribution(your_players, opp_players, step=DEFAULT_STEP):
+    """Distribution of your total minus the opponent's total."""
+    return difference(team_distribution(your_players, step=step), team_distribution(opp_players, step=step))
+
+
+def win_probability(your_players, opp_players, step=DEFAULT_STEP):
+    """
+    P(win) and margin statistics without sampling.
+
+    Rounding to the grid turns near-ties into exact ties, so half of the tie mass counts as a win.
+
+    Returns:
+        dict: {"p_win", "p_tie", "expected_margin", "margin_std", "step"}
+    """
+    offset, pmf = margin_distribution(your_players, opp_players, step=step)
+    margins = (offset + np.arange(len(pmf))) * step
+    p_tie = float(pmf[margins == 0].sum()) if offset <= 0 else 0.0
+    expected_margin = float(np.dot(margins, pmf))
+    return {
+        "p_win": float(pmf[margins > 0].sum()) + 0.5 * p_tie,
+        "p_tie": p_tie,
+        "expected_margin": expected_margin,
+        "margin_std": float(np.sqrt(max(np.dot((margins - expected_margin) ** 2, pmf), 0.0))),
+        "step": step,
+    }
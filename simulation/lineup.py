@@ -0,0 +1,139 @@
+from itertools import combinations
+
+import numpy as np
+
+from simulation import exact
+from simulation.team import Team
+
+# Players (by expected points) whose starting combinations are enumerated
+LINEUP_POOL = 14
+# Lineups (by expected points) scored with Monte Carlo
+LINEUP_CANDIDATES = 12
+LINEUP_SIMS = 20_000
+
+
+def match_slots(player_ids, slot_positions, can_fill):
+    """
+    Assign players to slots with Kuhn's augmenting-path bipartite matching.
+
+    Args:
+        player_ids (list): Players to seat
+        slot_positions (list): Position of each slot (e.g. "PG", "G", "UTIL")
+        can_fill (callable): can_fill(player_id, position) -> bool
+
+    Returns:
+        dict | None: slot index -> player_id with every player seated, or None if impossible
+    """
+    eligible = [[s for s, position in enumerate(slot_positions) if can_fill(player_id, position)]
+                for player_id in player_ids]
+    slot_owner = [None] * len(slot_positions)
+
+    def seat(p, visited):
+        for s in eligible[p]:
+            if s in visited:
+                continue
+            visited.add(s)
+            if slot_owner[s] is None or seat(slot_owner[s], visited):
+                slot_owner[s] = p
+                return True
+        return False
+
+    for p in range(len(player_ids)):
+        if not seat(p, set()):
+            return None
+    return {s: player_ids[p] for s, p in enumerate(slot_owner) if p is not None}
+
+
+def expected_points(player):
+    """Expected weekly points under the engine's model, from the (cached) exact distribution."""
+    row = Team.from_players([player]).data[0]
+    locked = None if np.isnan(row["locked"]) else float(row["locked"])
+    offset, pmf = exact.cached_player_distribution(
+        float(row["mean"]), float(row["std"]), int(row["games_left"]), locked, exact.DEFAULT_STEP
+    )
+    return float(np.dot((offset + np.arange(len(pmf))) * exact.DEFAULT_STEP, pmf))
+
+
+def optimize_lineup(players, roster_positions, can_fill, opp_players, current=None, pool=LINEUP_POOL,
+                    candidates=LINEUP_CANDIDATES, sims=LINEUP_SIMS, dtype=np.float64, rng=None):
+    """
+    Starting lineup that maximizes simulated p_win against the opponent.
+
+    Combinations of the `pool` best players by expected points are checked for slot
+    eligibility with bipartite matching; the `candidates` feasible lineups with the most expected
+    points are then scored on common random numbers, so they are compared on the same draws.
+
+    Args:
+        players (dict): player_id -> player dict (name, mean, std, games_left, locked) for the roster
+        roster_positions (list): League roster_positions; "BN" slots are skipped
+        can_fill (callable): can_fill(player_id, position) -> bool (e.g. PlayerMetadataStore.can_fill)
+        current (list): Current starters, scored alongside the candidates for comparison
+
+    Returns:
+        dict: {"slots" (slot index -> player_id), "starters", "p_win", "expected_points",
+               "current_p_win", "candidates", "sims_used", "seed"}
+    """
+    from simulation.simulation import FantasyNBASimulation
+
+    slot_indices = [i for i, position in enumerate(roster_positions) if position != "BN"]
+    slot_positions = [roster_positions[i] for i in slot_indices]
+    # players without a projection (e.g. injured, no qualifying game) are never recommended
+    means = {
+        player_id: expected_points(player) for player_id, player in players.items()
+        if np.isfinite(float(player["mean"])) and np.isfinite(float(player["std"]))
+    }
+    ranked = sorted(means, key=means.get, reverse=True)[:max(pool, len(slot_positions))]
+
+    # largest lineup the roster can field (a short roster leaves slots empty)
+    size = min(len(slot_positions), len(ranked))
+    feasible = []
+    while size and not feasible:
+        for subset in combinations(ranked, size):
+            assignment = match_slots(list(subset), slot_positions, can_fill)
+            if assignment is not None:
+                feasible.append((sum(means[p] for p in subset), subset, assignment))
+        size -= 1
+    if not feasible:
+        return {"error": "no projected players are eligible for the starting slots"}
+    feasible.sort(key=lambda item: item[0], reverse=True)
+    shortlist = feasible[:candidates]
+
+    lineups = [list(subset) for _, subset, _ in shortlist]
+    current = [p for p in (current or []) if p in players]
+    if current:
+        lineups.append(current)
+    pool_ids = list(dict.fromkeys(p for lineup in lineups for p in lineup))
+
+    # common random numbers: every lineup sums rows of the same simulated player columns
+    rng, seed = FantasyNBASimulation.make_rng(rng)
+    columns = FantasyNBASimulation.simulate_player_columns(
+        [players[p] for p in pool_ids], sims=sims, dtype=dtype, rng=rng
+    )
+    opp_totals = FantasyNBASimulation.simulate_player_columns(opp_players, sims=sims, dtype=dtype, rng=rng).sum(axis=0)
+    row = {p: i for i, p in enumerate(pool_ids)}
+    membership = np.zeros((len(lineups), len(pool_ids)), dtype=dtype)
+    for k, lineup in enumerate(lineups):
+        membership[k, [row[p] for p in lineup]] = 1
+    p_wins = np.count_nonzero(membership @ columns > opp_totals, axis=1) / sims
+
+    scored = [
+        {
+            "starters": list(subset),
+            "slots": {slot_indices[s]: player_id for s, player_id in assignment.items()},
+            "expected_points": total,
+            "p_win": float(p_win),
+        }
+        for (total, subset, assignment), p_win in zip(shortlist, p_wins)
+    ]
+    scored.sort(key=lambda item: item["p_win"], reverse=True)
+    best = scored[0]
+    return {
+        "slots": best["slots"],
+        "starters": best["starters"],
+        "p_win": best["p_win"],
+        "expected_points": best["expected_points"],
+        "current_p_win": float(p_wins[-1]) if current else None,
+        "candidates": scored,
+        "sims_used": sims,
+        "seed": seed,
+    }
@@ -0,0 +1,94 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from simulation.summary import MatchupSummary
+from simulation.team import Team
+
+# Sims per batch inside a worker, so worker memory doesn't grow with its share of the sims
+WORKER_BATCH = 100_000
+
+
+def split_evenly(sims, workers):
+    """Deterministic split of sims across workers (earlier workers take the remainder)."""
+    share, remainder = divmod(sims, workers)
+    return [share + (i < remainder) for i in range(workers)]
+
+
+def spawn_seeds(root, workers):
+    """
+    Child seeds of `root`, one per worker, without touching root's spawn counter.
+
+    SeedSequence.spawn advances n_children_spawned, so spawning from a caller's seed would
+    hand a second run with the same object different streams; these children only depend on
+    (root.entropy, root.spawn_key, workers).
+    """
+    return [
+        np.random.SeedSequence(root.entropy, spawn_key=root.spawn_key + (i,), pool_size=root.pool_size)
+        for i in range(workers)
+    ]
+
+
+def simulate_summary(your_team, opp_team, sims, seed_sequence, summary, dtype=np.float64):
+    """
+    Worker body: simulate `sims` matchups on its own stream and fold them into `summary`.
+
+    Returns:
+        MatchupSummary: counts, moments and histograms only
+    """
+    # imported here so the module stays importable from simulation.simulation
+    from simulation.simulation import FantasyNBASimulation
+
+    rng = np.random.Generator(FantasyNBASimulation.BIT_GENERATOR(seed_sequence))
+    remaining = sims
+    while remaining > 0:
+        size = min(WORKER_BATCH, remaining)
+        your_totals = FantasyNBASimulation.simulate_player_columns(your_team, size, dtype=dtype, rng=rng).sum(axis=0)
+        opp_totals = FantasyNBASimulation.simulate_player_columns(opp_team, size, dtype=dtype, rng=rng).sum(axis=0)
+        summary.update(your_totals, opp_totals)
+        remaining -= size
+    return summary
+
+
+def parallel_win_probability(your_players, opp_players, sims=1_000_000, workers=None, seed=None,
+                             dtype=np.float64, confidence=0.95):
+    """
+    Split sims across a process pool; each worker draws from its own child of the root seed
+    and returns only a MatchupSummary (counts, sums, histograms).
+
+    The split and the child seeds depend only on (seed, workers), and results are combined in
+    worker order, so a given seed and worker count always reproduce the same answer; the
+    caller's SeedSequence is left as it was.
+
+    Args:
+        workers (int): Worker processes (default: os.cpu_count()); 1 runs in-process
+        seed (int | SeedSequence): Root seed; a fresh one is drawn (and reported) if None
+
+    Returns:
+        dict: MatchupSummary.to_dict() fields plus "seed", "spawn_key" and "workers" -
+            SeedSequence(seed, spawn_key=spawn_key) with the same workers replays the run
+    """
+    your_team = Team.from_players(your_players)
+    opp_team = Team.from_players(opp_players)
+    workers = max(1, min(workers or os.cpu_count() or 1, sims))
+    root = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    children = spawn_seeds(root, workers)
+    # every worker starts from an empty summary with the same bins
+    empty = MatchupSummary.for_teams(your_team, opp_team)
+    args = [(your_team, opp_team, share, child, empty, dtype) for share, child in zip(split_evenly(sims, workers), children)]
+
+    if workers == 1:
+        parts = [simulate_summary(*args[0])]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(simulate_summary, *zip(*args)))
+
+    summary = parts[0]
+    for part in parts[1:]:
+        summary.merge(part)
+    result = summary.to_dict(confidence)
+    result["seed"] = root.entropy
+    result["spawn_key"] = root.spawn_key
+    result["workers"] = workers
+    return result
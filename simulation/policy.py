@@ -0,0 +1,128 @@
+from functools import lru_cache
+
+import numpy as np
+
+from simulation import exact
+from simulation.team import Team
+
+# Half-point buckets keep a full policy refresh in the low milliseconds
+POLICY_STEP = 0.5
+
+
+class LockPolicy:
+    """
+    Optimal lock rule for one of your players, by backward induction over their remaining games.
+
+    After each game the player's score for that game can be locked (it becomes their week) or
+    dropped for the next game; the last game's score is kept. Everything else in the matchup is
+    summarized by the distribution of its unbanked margin (your other players minus the
+    opponent's, from the exact engine) plus the banked margin, so the value function only
+    depends on (games remaining, margin bucket):
+
+        W(m + x)  = P(win | this player finishes at x, banked margin m)
+        V(0, m)   = 0
+        V(k, m)   = E_x[max(W(m + x), V(k - 1, m))]
+
+    and after a game with k games still to come the player should lock when W(m + x) >= V(k, m).
+    V is memoized on (k, margin bucket), so refreshing thresholds as other players lock is a
+    cache lookup or one O(grid) dot product.
+
+    Args:
+        mean, std (float): The player's per-game score distribution
+        rest_distribution (tuple): (offset, pmf) of the unbanked margin of everyone else
+    """
+
+    def __init__(self, mean, std, rest_distribution, step=POLICY_STEP):
+        self.step = step
+        # a single game's score grid: pmf[j] is the probability of (game_offset + j) * step points
+        self.game_offset, self.game_pmf = exact.cached_player_distribution(float(mean), float(std), 1, None, step)
+        self.game_buckets = self.game_offset + np.arange(len(self.game_pmf))
+        offset, pmf = rest_distribution
+        # rest_cdf[i] = P(rest < offset + i) on the grid
+        self.rest_offset = offset
+        self.rest_cdf = np.concatenate(([0.0], np.cumsum(pmf)))
+        self.value = lru_cache(maxsize=None)(self._value)
+
+    def win_curve(self, buckets):
+        """P(win) when everyone else's unbanked margin must beat -buckets (ties count half)."""
+        # P(rest > -b) + 0.5 * P(rest == -b) = 1 - (P(rest <= -b) + P(rest < -b)) / 2
+        index = -np.asarray(buckets) - self.rest_offset
+        last = len(self.rest_cdf) - 1
+        at_most = self.rest_cdf[np.clip(index + 1, 0, last)]
+        below = self.rest_cdf[np.clip(index, 0, last)]
+        return 1.0 - 0.5 * (at_most + below)
+
+    def _value(self, games, margin_bucket):
+        if games <= 0:
+            return 0.0
+        finish = self.win_curve(margin_bucket + self.game_buckets)
+        return float(np.dot(self.game_pmf, np.maximum(finish, self.value(games - 1, margin_bucket))))
+
+    def threshold(self, games_after, margin_bucket):
+        """
+        Lowest score worth locking after a game with `games_after` games still to come.
+
+        Returns:
+            float | None: None when no score this player can reach is worth locking
+        """
+        if games_after <= 0:
+            return 0.0
+        finish = self.win_curve(margin_bucket + self.game_buckets)
+        index = int(np.searchsorted(finish, self.value(games_after, margin_bucket)))
+        if index == len(self.game_buckets):
+            return None
+        return float(self.game_buckets[index] * self.step)
+
+    def lock_value(self, score, margin_bucket):
+        return float(self.win_curve(margin_bucket + int(round(score / self.step))))
+
+
+def optimal_lock_policy(your_players, opp_players, step=POLICY_STEP):
+    """
+    Per-game lock thresholds for every one of your players with games to play.
+
+    A live player (current_live_score set, unlocked) is deciding on that score now, with
+    games_left games still to come. Each player's policy treats the rest of the matchup as
+    playing out under the engine's model, i.e. other players' future locks are not anticipated.
+
+    Returns:
+        dict: {"players": [{"player_index", "player_name", "thresholds", "lock_now",
+               "p_win_if_lock", "p_win_if_wait"}], "banked_margin", "step"}
+    """
+    your_team = Team.from_players(your_players)
+    opp_team = Team.from_players(opp_players)
+    your_locked = your_team.is_locked
+    banked = float(np.sum(your_team.data["locked"][your_locked]) - np.sum(opp_team.data["locked"][opp_team.is_locked]))
+    opp_open = ~opp_team.is_locked
+    opp_distribution = exact.team_distribution(
+        Team([name for name, keep in zip(opp_team.names, opp_open) if keep], opp_team.data[opp_open]), step=step
+    )
+
+    players = []
+    for i, row in enumerate(your_team.data):
+        live = not your_locked[i] and not np.isnan(row["live_score"])
+        if your_locked[i] or (row["games_left"] <= 0 and not live):
+            continue
+        others = ~your_locked
+        others[i] = False
+        others_team = Team([name for name, keep in zip(your_team.names, others) if keep], your_team.data[others])
+        rest = exact.difference(exact.team_distribution(others_team, step=step), opp_distribution)
+        policy = LockPolicy(row["mean"], row["std"], rest, step=step)
+        margin_bucket = int(round(banked / step))
+        games = int(row["games_left"])
+        entry = {
+            "player_index": i,
+            "player_name": your_team.names[i],
+            # entry g: lock after game g + 1 if it scores at least this much (None: never lock;
+            # the last game is always kept)
+            "thresholds": [policy.threshold(games - g - 1, margin_bucket) for g in range(games)],
+            "p_win_if_wait": policy.value(games, margin_bucket),
+            "lock_now": None,
+            "p_win_if_lock": None,
+        }
+        if live:
+            entry["thresholds"].insert(0, policy.threshold(games, margin_bucket))
+            entry["p_win_if_lock"] = policy.lock_value(row["live_score"], margin_bucket)
+            entry["lock_now"] = entry["thresholds"][0] is not None and bool(row["live_score"] >= entry["thresholds"][0])
+        players.append(entry)
+    return {"players": players, "banked_margin": banked, "step": step}
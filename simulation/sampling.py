@@ -0,0 +1,57 @@
+import warnings
+
+import numpy as np
+
+# scipy is only needed for Sobol sampling
+try:
+    from scipy.special import ndtri
+    from scipy.stats import qmc
+except ImportError:
+    ndtri = None
+    qmc = None
+
+SAMPLING_METHODS = ("random", "antithetic", "sobol")
+# Independent scrambles used for the randomized QMC error estimate
+SOBOL_REPLICATES = 8
+
+
+class NormalSampler:
+    """
+    Source of (n x dims) standard normal draws for one simulation run, one column per game.
+
+    - "random": plain pseudo-random draws
+    - "antithetic": every draw z is paired with -z (the first half of each batch mirrors into
+      the second), so paired outcomes are negatively correlated
+    - "sobol": a scrambled Sobol sequence mapped through the inverse normal CDF; consecutive
+      draw() calls continue the sequence. Powers of two for n keep its balance properties.
+
+    Args:
+        dims (int): Number of columns (total remaining games being simulated)
+        rng (np.random.Generator): Draws for "random"/"antithetic", scrambling seed for "sobol"
+    """
+
+    def __init__(self, dims, rng, method="random", dtype=np.float64):
+        if method not in SAMPLING_METHODS:
+            raise ValueError(f"Unknown sampling method {method!r}; expected one of {SAMPLING_METHODS}")
+        if method == "sobol" and qmc is None:
+            raise ImportError("Sobol sampling requires scipy (pip install scipy)")
+        self.dims = dims
+        self.rng = rng
+        self.method = method
+        self.dtype = dtype
+        self._sobol = qmc.Sobol(d=dims, scramble=True, seed=rng) if method == "sobol" and dims else None
+
+    def draw(self, n):
+        if self.method == "random" or not self.dims:
+            return self.rng.standard_normal((n, self.dims), dtype=self.dtype)
+        if self.method == "antithetic":
+            half = n // 2
+            z = self.rng.standard_normal((n - half, self.dims), dtype=self.dtype)
+            # rows i and half + i are a pair; an odd n leaves one unpaired draw at the end
+            return np.concatenate([z[:half], -z[:half], z[half:]])
+        with warnings.catch_warnings():
+            # non power-of-two batches only weaken the balance guarantee
+            warnings.simplefilter("ignore", UserWarning)
+            points = self._sobol.random(n)
+        # keep ndtri finite at the (measure-zero) edges of the unit cube
+        return ndtri(np.clip(points, 1e-12, 1 - 1e-12)).astype(self.dtype)
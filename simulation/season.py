@@ -0,0 +1,160 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from simulation import exact
+from simulation.parallel import spawn_seeds, split_evenly
+
+# Coarser grid than single-week odds: season standings don't need 0.1 pt resolution
+SEASON_STEP = 0.5
+# Seasons simulated per vectorized batch inside a worker
+SEASON_BATCH = 20_000
+# Points-for only breaks ties in wins, so it is scaled below one win
+WIN_WEIGHT = 1e7
+
+
+def simulate_seasons(team_cdfs, offsets, schedule, base_wins, base_points, seasons, seed_sequence,
+                     step=SEASON_STEP):
+    """
+    Worker body: simulate `seasons` rest-of-seasons on its own stream.
+
+    Every team's weekly score is drawn by inverse-CDF sampling from its (cached) weekly
+    distribution for all seasons and weeks at once; standings are ranked by wins, then points.
+
+    Returns:
+        tuple: (seed_counts (teams x teams), wins_sum (teams,))
+    """
+    # imported here so the module stays importable from simulation.simulation
+    from simulation.simulation import FantasyNBASimulation
+
+    rng = np.random.Generator(FantasyNBASimulation.BIT_GENERATOR(seed_sequence))
+    teams = len(team_cdfs)
+    weeks = len(schedule)
+    seed_counts = np.zeros((teams, teams), dtype=np.int64)
+    wins_sum = np.zeros(teams)
+    remaining = seasons
+    while remaining > 0:
+        size = min(SEASON_BATCH, remaining)
+        scores = np.empty((teams, size, weeks))
+        for t, cdf in enumerate(team_cdfs):
+            draws = np.searchsorted(cdf, rng.random((size, weeks)))
+            scores[t] = (offsets[t] + np.minimum(draws, len(cdf) - 1)) * step
+
+        wins = np.broadcast_to(base_wins, (size, teams)).copy()
+        for w, pairs in enumerate(schedule):
+            for a, b in pairs:
+                margin = scores[a, :, w] - scores[b, :, w]
+                result = np.where(margin > 0, 1.0, np.where(margin < 0, 0.0, 0.5))
+                wins[:, a] += result
+                wins[:, b] += 1.0 - result
+        points = base_points + scores.sum(axis=2).T
+
+        order = np.argsort(-(wins * WIN_WEIGHT + points), axis=1, kind="stable")
+        # order[s, k] is the team finishing k-th (seed k + 1) in season s
+        seed_counts += np.bincount(
+            (order * teams + np.arange(teams)).ravel(), minlength=teams * teams
+        ).reshape(teams, teams)
+        wins_sum += wins.sum(axis=0)
+        remaining -= size
+    return seed_counts, wins_sum
+
+
+class FantasySeasonSimulation:
+    """
+    Rest-of-season standings and playoff odds.
+
+    Each roster's weekly score distribution is built once from cached per-player distributions
+    (see simulation/exact.py) and reused for every remaining week; seasons are simulated in
+    vectorized batches and can be split across worker processes.
+    """
+
+    @staticmethod
+    def standings_from_rosters(rosters):
+        """
+        Current record per roster from Sleeper roster settings.
+
+        Returns:
+            dict: roster_id -> {"wins", "losses", "ties", "fpts"}
+        """
+        standings = {}
+        for roster in rosters:
+            settings = roster.get("settings") or {}
+            standings[roster["roster_id"]] = {
+                "wins": settings.get("wins", 0),
+                "losses": settings.get("losses", 0),
+                "ties": settings.get("ties", 0),
+                "fpts": settings.get("fpts", 0) + settings.get("fpts_decimal", 0) / 100,
+            }
+        return standings
+
+    @staticmethod
+    def playoff_format(league_info):
+        """
+        Returns:
+            tuple: (playoff_teams, byes, playoff_week_start)
+        """
+        settings = league_info.get("settings") or {}
+        playoff_teams = int(settings.get("playoff_teams") or 6)
+        # byes fill the bracket up to the next power of two (6 teams -> 2 byes)
+        byes = (1 << (playoff_teams - 1).bit_length()) - playoff_teams
+        return playoff_teams, byes, settings.get("playoff_week_start")
+
+    @staticmethod
+    def weekly_distribution(players, step=SEASON_STEP):
+        """A roster's weekly score distribution as (offset, cdf)."""
+        offset, pmf = exact.team_distribution(players, step=step)
+        return offset, np.cumsum(pmf)
+
+    @staticmethod
+    def simulate_season(teams, schedule, standings, playoff_teams=6, byes=0, seasons=100_000, workers=1,
+                        rng=None, step=SEASON_STEP):
+        """
+        Simulate every remaining week for all teams together.
+
+        Args:
+            teams (dict): roster_id -> weekly player dicts (name, mean, std, games_left)
+            schedule (list): One list of (roster_id, roster_id) pairs per remaining regular-season week
+            standings (dict): roster_id -> current {"wins", "ties", "fpts"} (standings_from_rosters)
+            workers (int): Worker processes; seasons are split deterministically per seed
+            rng (int | SeedSequence): Root seed, reported back; a SeedSequence is left unchanged
+
+        Returns:
+            dict: {"teams": {roster_id: {"playoff_prob", "bye_prob", "seed_probs", "expected_wins"}},
+                   "seasons", "seed", "spawn_key"} - SeedSequence(seed, spawn_key=spawn_key) with the
+                   same workers replays the run
+        """
+        roster_ids = sorted(teams)
+        index = {roster_id: i for i, roster_id in enumerate(roster_ids)}
+        distributions = [FantasySeasonSimulation.weekly_distribution(teams[rid], step=step) for rid in roster_ids]
+        offsets = np.array([offset for offset, _ in distributions])
+        cdfs = [cdf for _, cdf in distributions]
+        week_pairs = [[(index[a], index[b]) for a, b in pairs if a in index and b in index] for pairs in schedule]
+        base_wins = np.array([standings.get(rid, {}).get("wins", 0) + 0.5 * standings.get(rid, {}).get("ties", 0)
+                              for rid in roster_ids], dtype=float)
+        base_points = np.array([standings.get(rid, {}).get("fpts", 0.0) for rid in roster_ids], dtype=float)
+
+        root = rng if isinstance(rng, np.random.SeedSequence) else np.random.SeedSequence(rng)
+        workers = max(1, min(workers or os.cpu_count() or 1, seasons))
+        args = [
+            (cdfs, offsets, week_pairs, base_wins, base_points, share, child, step)
+            for share, child in zip(split_evenly(seasons, workers), spawn_seeds(root, workers))
+        ]
+        if workers == 1:
+            parts = [simulate_seasons(*args[0])]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                parts = list(pool.map(simulate_seasons, *zip(*args)))
+
+        seed_counts = sum(part[0] for part in parts)
+        wins_sum = sum(part[1] for part in parts)
+        seed_probs = seed_counts / seasons
+        results = {}
+        for rid, i in index.items():
+            results[rid] = {
+                "playoff_prob": float(seed_probs[i, :playoff_teams].sum()),
+                "bye_prob": float(seed_probs[i, :byes].sum()),
+                "seed_probs": seed_probs[i].tolist(),
+                "expected_wins": float(wins_sum[i] / seasons),
+            }
+        return {"teams": results, "seasons": seasons, "seed": root.entropy, "spawn_key": root.spawn_key}
@@ -1,12 +1,42 @@
+from statistics import NormalDist
+
 import numpy as np
 
+from simulation import exact, lineup, parallel, policy, thresholds
+from simulation.sampling import NormalSampler, SOBOL_REPLICATES
+from simulation.summary import MatchupSummary
+from simulation.team import Team
+
 class FantasyNBASimulation:
+    # ---------------------------
+    # Random number generation
+    # ---------------------------
+    # Every entry point takes rng=: a numpy Generator, an int seed / SeedSequence, or None for a
+    # fresh seed. Nothing touches the global np.random state, so concurrent sessions don't share
+    # a stream, and the same seed replays the same draws when comparing engine changes.
+    BIT_GENERATOR = np.random.PCG64
+
+    @staticmethod
+    def make_rng(rng=None):
+        """
+        Resolve an rng argument.
+
+        Returns:
+            tuple: (np.random.Generator, seed) - seed is the root entropy to pass back in to
+                reproduce the run, or None when the caller supplied their own Generator
+        """
+        if isinstance(rng, np.random.Generator):
+            return rng, None
+        seed_sequence = rng if isinstance(rng, np.random.SeedSequence) else np.random.SeedSequence(rng)
+        return np.random.Generator(FantasyNBASimulation.BIT_GENERATOR(seed_sequence)), seed_sequence.entropy
+
     @staticmethod
-    def simulate_fantasy_points(mean, stddev, games_left, num_simulations=200, clip_at_zero=True):
+    def simulate_fantasy_points(mean, stddev, games_left, num_simulations=200, clip_at_zero=True, rng=None):
         if games_left <= 0:
             return np.zeros(num_simulations)
         
-        weekly = np.random.normal(loc=mean, scale=stddev, size=(num_simulations, games_left))
+        rng, _ = FantasyNBASimulation.make_rng(rng)
+        weekly = rng.normal(loc=mean, scale=stddev, size=(num_simulations, games_left))
         if clip_at_zero:
             weekly = np.clip(weekly, 0, None)
         totals = weekly.max(axis=1)
@@ -38,98 +68,362 @@ class FantasyNBASimulation:
     # Win probability against opponent is P(Team_total + locked_you > Opp_total + locked_opp).
     # We estimate this probability via Monte Carlo by drawing many random totals and counting wins.
 
+    # ---------------------------
+    # Batched engine
+    # ---------------------------
+    # A player's week is the best of their remaining games, clipped at zero. For std >= 0,
+    #   max_j clip(mu + sigma * Z_j) = clip(mu + sigma * max_j Z_j)
+    # so the engine draws one (sims x total games) block of standard normals per chunk, reduces
+    # each player's columns to their max and applies one affine transform for the whole roster.
+    # Chunking over sims keeps the draw block a fixed size.
+    CHUNK_ELEMENTS = 1 << 22
+
+    @staticmethod
+    def draw_max_normals(team, sims=20000, dtype=np.float64, rng=None, chunk_size=None, sampler=None):
+        """
+        Max standard normal over each player's remaining games.
+
+        These are the only random numbers the engine needs, so sharing them between two
+        simulations (common random numbers) makes the simulations differ only where the teams do.
+        Players with no games left (or locked) still get a row (-inf) so rows stay aligned.
+
+        Args:
+            sampler (NormalSampler): Draw source with dims == team.total_games (default: plain
+                pseudo-random draws from rng)
+
+        Returns:
+            np.ndarray: (players x sims) array of dtype
+        """
+        team = Team.from_players(team)
+        if sampler is None:
+            rng, _ = FantasyNBASimulation.make_rng(rng)
+            sampler = NormalSampler(team.total_games, rng, dtype=dtype)
+        max_normals = np.full((len(team), sims), -np.inf, dtype=dtype)
+        games_left = team.data["games_left"]
+        active = np.flatnonzero(games_left > 0)
+        if not len(active):
+            return max_normals
+        # first column of each active player's games in the draw block
+        starts = np.concatenate(([0], np.cumsum(games_left[active])[:-1]))
+        if chunk_size is None:
+            chunk_size = max(1, FantasyNBASimulation.CHUNK_ELEMENTS // sampler.dims)
+        for start in range(0, sims, chunk_size):
+            stop = min(start + chunk_size, sims)
+            block = sampler.draw(stop - start)
+            max_normals[active, start:stop] = np.maximum.reduceat(block, starts, axis=1).T
+        return max_normals
+
+    @staticmethod
+    def points_from_max_normals(team, max_normals, clip_at_zero=True):
+        team = Team.from_players(team)
+        data = team.data
+        dtype = max_normals.dtype
+        with np.errstate(invalid="ignore"):
+            points = data["mean"].astype(dtype)[:, None] + np.abs(data["std"]).astype(dtype)[:, None] * max_normals
+        if clip_at_zero:
+            np.clip(points, 0, None, out=points)
+        points[data["games_left"] <= 0] = 0
+        locked = team.is_locked
+        points[locked] = data["locked"][locked].astype(dtype)[:, None]
+        return points
+
     # ---------------------------
     # Team-level simulation
     # ---------------------------
     @staticmethod
-    def simulate_team_totals(players, sims=20000):
-        sims = sims
-        team_total = np.zeros(sims)
-        breakdown = {}
-        for p in players:
-            if p.get("locked") is not None:
-                arr = np.full(sims, float(p["locked"]))
-            else:
-                arr = FantasyNBASimulation.simulate_fantasy_points(
-                    mean=p["mean"],
-                    stddev=p["std"],
-                    games_left=p.get("games_left", 0),
-                    num_simulations=sims
-                )
-            breakdown[p["name"]] = arr
-            team_total += arr
-        return team_total, breakdown
+    def simulate_player_columns(players, sims=20000, normals=None, dtype=np.float64, rng=None):
+        """
+        Simulate every player's weekly points once.
+
+        Args:
+            players (list | Team): Player dicts or a Team
+            normals (np.ndarray): Shared draws from draw_max_normals (drawn fresh if None)
+            dtype: np.float64 or np.float32
+
+        Returns:
+            np.ndarray: (players x sims) array, one row per player in roster order
+        """
+        team = Team.from_players(players)
+        if normals is None:
+            rng, _ = FantasyNBASimulation.make_rng(rng)
+            normals = FantasyNBASimulation.draw_max_normals(team, sims, dtype=dtype, rng=rng)
+        return FantasyNBASimulation.points_from_max_normals(team, normals)
+
+    @staticmethod
+    def simulate_team_totals(players, sims=20000, normals=None, dtype=np.float64, rng=None):
+        team = Team.from_players(players)
+        columns = FantasyNBASimulation.simulate_player_columns(team, sims=sims, normals=normals, dtype=dtype, rng=rng)
+        breakdown = dict(zip(team.names, columns))
+        return columns.sum(axis=0), breakdown
+
+    # ---------------------------
+    # Confidence intervals / adaptive stopping
+    # ---------------------------
+    # With a target_precision, simulations run in batches of batch_size until the confidence
+    # interval half-width drops to the target or max_sims is spent, so lopsided matchups stop
+    # after one batch and close ones get the samples they need.
+    @staticmethod
+    def z_score(confidence=0.95):
+        return NormalDist().inv_cdf(0.5 + confidence / 2)
+
+    @staticmethod
+    def wilson_interval(wins, n, confidence=0.95):
+        """Wilson score interval for a win rate (well-behaved near 0 and 1, unlike p +/- z*se)."""
+        if n == 0:
+            return 0.0, 1.0
+        z = FantasyNBASimulation.z_score(confidence)
+        p = wins / n
+        denominator = 1 + z * z / n
+        center = (p + z * z / (2 * n)) / denominator
+        half_width = z * np.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denominator
+        return float(max(center - half_width, 0.0)), float(min(center + half_width, 1.0))
 
     # ---------------------------
     # Win probability vs opponent
     # ---------------------------
     @staticmethod
-    def estimate_win_probability(your_players, opp_players, sims=20000):
-        your_totals, _ = FantasyNBASimulation.simulate_team_totals(your_players, sims=sims)
-        opp_totals, _ = FantasyNBASimulation.simulate_team_totals(opp_players, sims=sims)
-        p_win = np.mean(your_totals > opp_totals)
-        # Also return expected margins
-        expected_margin = np.mean(your_totals - opp_totals)
+    def estimate_win_probability(your_players, opp_players, sims=20000, your_normals=None, opp_normals=None,
+                                 dtype=np.float64, rng=None, target_precision=None, max_sims=1_000_000,
+                                 batch_size=10_000, confidence=0.95, keep_arrays=False, sampling="random"):
+        """
+        Monte Carlo P(win) and expected margin.
+
+        Sims run in chunks of batch_size folded into a MatchupSummary (counts, moments and
+        fixed-bin histograms), so memory doesn't grow with the number of sims. Both teams are
+        drawn from one sampler, so antithetic/Sobol points cover the whole matchup.
+
+        Args:
+            sims (int): Number of simulations (fixed-size mode)
+            target_precision (float): If set, simulate in batches until the CI half-width on p_win
+                is at most this (e.g. 0.005 for +/-0.5%) or max_sims is reached; sims is ignored.
+                Shared draws (your_normals / opp_normals) always use their own size.
+            keep_arrays (bool): Also return the per-sim "your_totals" / "opp_totals" arrays
+            sampling (str): "random", "antithetic" or "sobol" (scrambled Sobol, needs scipy; split
+                into SOBOL_REPLICATES independent scrambles for the error estimate). Powers of two
+                for sims / batch_size suit Sobol best.
+
+        Returns:
+            dict: MatchupSummary.to_dict() fields ("p_win", "expected_margin", "ci", "sims_used",
+                "your_mean", "histograms", ...) plus "std_error", "sampling" and "seed"
+        """
+        your_team = Team.from_players(your_players)
+        opp_team = Team.from_players(opp_players)
+        rng, seed = FantasyNBASimulation.make_rng(rng)
+        shared = your_normals if your_normals is not None else opp_normals
+        if shared is not None:
+            sims = shared.shape[1]
+            sampling = "random"
+        adaptive = target_precision is not None and shared is None
+
+        matchup = Team.concat(your_team, opp_team)
+        replicates = SOBOL_REPLICATES if sampling == "sobol" else 1
+        samplers = [None] if shared is not None else [
+            NormalSampler(matchup.total_games, rng, method=sampling, dtype=dtype) for _ in range(replicates)
+        ]
+        replicate_wins = np.zeros(replicates)
+        replicate_sims = np.zeros(replicates)
+        # antithetic error estimate works on the mean outcome of each (z, -z) pair
+        pair_sum = pair_sq_sum = pairs = 0
+
+        summary = MatchupSummary.for_teams(your_team, opp_team)
+        your_batches, opp_batches = [], []
+        while True:
+            start = summary.sims
+            size = min(batch_size, (max_sims if adaptive else sims) - start)
+            for r, (sampler, n) in enumerate(zip(samplers, parallel.split_evenly(size, len(samplers)))):
+                if sampler is None:
+                    your_chunk = None if your_normals is None else your_normals[:, start:start + n]
+                    opp_chunk = None if opp_normals is None else opp_normals[:, start:start + n]
+                else:
+                    # antithetic pairs are row i and n // 2 + i of one draw, so the batch must be a
+                    # single sampler.draw(n) for the pair error estimate below to line up
+                    normals = FantasyNBASimulation.draw_max_normals(
+                        matchup, n, dtype=dtype, sampler=sampler, chunk_size=n if sampling == "antithetic" else None
+                    )
+                    your_chunk, opp_chunk = normals[:len(your_team)], normals[len(your_team):]
+                your_totals, _ = FantasyNBASimulation.simulate_team_totals(
+                    your_team, sims=n, dtype=dtype, rng=rng, normals=your_chunk
+                )
+                opp_totals, _ = FantasyNBASimulation.simulate_team_totals(
+                    opp_team, sims=n, dtype=dtype, rng=rng, normals=opp_chunk
+                )
+                summary.update(your_totals, opp_totals)
+                if keep_arrays:
+                    your_batches.append(your_totals)
+                    opp_batches.append(opp_totals)
+
+                wins = your_totals > opp_totals
+                replicate_wins[r] += np.count_nonzero(wins)
+                replicate_sims[r] += n
+                if sampling == "antithetic":
+                    half = n // 2
+                    pair_means = (wins[:half].astype(np.float64) + wins[half:2 * half]) / 2
+                    pair_sum += pair_means.sum()
+                    pair_sq_sum += np.dot(pair_means, pair_means)
+                    pairs += half
+
+            p_win = summary.wins / summary.sims
+            if sampling == "sobol":
+                std_error = float(np.std(replicate_wins / replicate_sims, ddof=1) / np.sqrt(replicates))
+            elif sampling == "antithetic" and pairs:
+                std_error = float(np.sqrt(max(pair_sq_sum / pairs - (pair_sum / pairs) ** 2, 0.0) / pairs))
+            else:
+                std_error = float(np.sqrt(p_win * (1 - p_win) / summary.sims))
+            if sampling == "random":
+                ci = FantasyNBASimulation.wilson_interval(summary.wins, summary.sims, confidence)
+            else:
+                half_width = FantasyNBASimulation.z_score(confidence) * std_error
+                ci = (max(p_win - half_width, 0.0), min(p_win + half_width, 1.0))
+
+            if adaptive:
+                if (ci[1] - ci[0]) / 2 <= target_precision or summary.sims >= max_sims:
+                    break
+            elif summary.sims >= sims:
+                break
+
+        result = summary.to_dict(confidence)
+        result.update({"ci": ci, "std_error": std_error, "sampling": sampling, "seed": seed})
+        if keep_arrays:
+            result["your_totals"] = np.concatenate(your_batches)
+            result["opp_totals"] = np.concatenate(opp_batches)
+        return result
+
+    # ---------------------------
+    # Multi-core win probability
+    # ---------------------------
+    # Splits the sims across a process pool (see simulation/parallel.py). Every worker has its own
+    # SeedSequence.spawn stream and sends back win counts, sums and a margin histogram only.
+    @staticmethod
+    def parallel_win_probability(your_players, opp_players, sims=1_000_000, workers=None, rng=None,
+                                 dtype=np.float64):
+        # workers need a spawnable root seed rather than a Generator
+        seed = rng.bit_generator.seed_seq if isinstance(rng, np.random.Generator) else rng
+        return parallel.parallel_win_probability(
+            your_players, opp_players, sims=sims, workers=workers, seed=seed, dtype=dtype
+        )
+
+    # ---------------------------
+    # Exact win probability (no sampling)
+    # ---------------------------
+    # Each player's weekly distribution has a closed-form CDF, Phi((x - mu) / sigma) ** G clipped
+    # at zero, so it is discretized on a shared grid and the team totals are FFT convolutions
+    # (see simulation/exact.py). Noise-free and independent of any sims count.
+    @staticmethod
+    def exact_win_probability(your_players, opp_players, step=exact.DEFAULT_STEP):
+        return exact.win_probability(your_players, opp_players, step=step)
+
+    # ---------------------------
+    # Whole league week
+    # ---------------------------
+    # Every roster in the week is stacked into one Team and drawn from one sampler per batch;
+    # team totals come from a single (teams x players) @ (players x sims) product and each
+    # matchup streams into its own MatchupSummary.
+    @staticmethod
+    def simulate_league_week(teams, pairs, sims=20000, dtype=np.float64, rng=None, batch_size=10_000,
+                             sampling="random", confidence=0.95):
+        """
+        Win odds for every matchup of a week in one batched run.
+
+        Args:
+            teams (dict): roster_id -> player dicts (or Team)
+            pairs (list): (roster_id, roster_id) matchups, e.g. from get_week_matchup_pairs
+
+        Returns:
+            dict: {"matchups": [{"roster_ids", "p_win", "expected_margin", "margin_quantiles",
+                "histograms", ...} per pair, from the first roster's side], "sims_used", "seed"}
+        """
+        rng, seed = FantasyNBASimulation.make_rng(rng)
+        roster_ids = list(dict.fromkeys(roster_id for pair in pairs for roster_id in pair))
+        rows = {roster_id: i for i, roster_id in enumerate(roster_ids)}
+        team_list = [Team.from_players(teams[roster_id]) for roster_id in roster_ids]
+        league = Team.concat(*team_list)
+
+        membership = np.zeros((len(team_list), len(league)), dtype=dtype)
+        start = 0
+        for i, team in enumerate(team_list):
+            membership[i, start:start + len(team)] = 1
+            start += len(team)
+
+        summaries = [MatchupSummary.for_teams(team_list[rows[a]], team_list[rows[b]]) for a, b in pairs]
+        sampler = NormalSampler(league.total_games, rng, method=sampling, dtype=dtype)
+        sims_used = 0
+        while sims_used < sims:
+            size = min(batch_size, sims - sims_used)
+            normals = FantasyNBASimulation.draw_max_normals(league, size, dtype=dtype, sampler=sampler)
+            totals = membership @ FantasyNBASimulation.points_from_max_normals(league, normals)
+            for summary, (a, b) in zip(summaries, pairs):
+                summary.update(totals[rows[a]], totals[rows[b]])
+            sims_used += size
+
         return {
-            "p_win": float(p_win),
-            "expected_margin": float(expected_margin),
-            "your_totals": your_totals,
-            "opp_totals": opp_totals
+            "matchups": [
+                {"roster_ids": (a, b), **summary.to_dict(confidence)} for summary, (a, b) in zip(summaries, pairs)
+            ],
+            "sims_used": sims_used,
+            "seed": seed
         }
 
     # ---------------------------
     # Evaluate locking one player
     # ---------------------------
     @staticmethod
-    def evaluate_lock_effect(player_index, your_players, opp_players, sims=20000):
-        # Defensive copy
-        import copy
-        your_copy = copy.deepcopy(your_players)
-        opp_copy = copy.deepcopy(opp_players)
+    def lock_action(delta, threshold=0.005):
+        # Simple decision rule:
+        # - if locking increases win prob by > threshold, recommend lock
+        # - if decreases by > threshold, recommend wait (i.e., don't lock)
+        # threshold can be tuned; we set a small default like 0.005 (0.5% change)
+        if delta > threshold:
+            return "lock"
+        if delta < -threshold:
+            return "wait"
+        return "indifferent"
+
+    @staticmethod
+    def evaluate_lock_effect(player_index, your_players, opp_players, sims=20000, common_random_numbers=True,
+                             your_normals=None, opp_normals=None, dtype=np.float64, rng=None, keep_arrays=False):
+        your_team = Team.from_players(your_players)
+        opp_team = Team.from_players(opp_players)
+        rng, seed = FantasyNBASimulation.make_rng(rng)
 
-        p = your_copy[player_index]
-        current_locked_val = p.get("current_live_score", None)
-        if current_locked_val is None:
+        if np.isnan(your_team.data["live_score"][player_index]):
             # nothing to lock (player hasn't played yet) -> no difference
             return {
                 "error": "no current_live_score: nothing to lock for this player",
                 "recommended_action": "none"
             }
 
+        # Both branches share the same draws unless explicitly disabled (or supplied by the caller)
+        if common_random_numbers and your_normals is None:
+            your_normals = FantasyNBASimulation.draw_max_normals(your_team, sims, dtype=dtype, rng=rng)
+            opp_normals = FantasyNBASimulation.draw_max_normals(opp_team, sims, dtype=dtype, rng=rng)
+
         # branch A: lock this player's current score (replace player's future with locked)
-        your_lock = copy.deepcopy(your_copy)
-        your_lock[player_index]["locked"] = float(current_locked_val)
-        your_lock[player_index].pop("games_left", None)  # no more future games for this slot once locked
+        your_lock = your_team.with_lock(player_index)
 
-        res_lock = FantasyNBASimulation.estimate_win_probability(your_lock, opp_copy, sims=sims)
+        res_lock = FantasyNBASimulation.estimate_win_probability(
+            your_lock, opp_team, sims=sims, your_normals=your_normals, opp_normals=opp_normals, dtype=dtype, rng=rng,
+            keep_arrays=keep_arrays
+        )
         p_win_lock = res_lock["p_win"]
 
         # branch B: do NOT lock -> this player's remaining games simulated normally.
         # If the player also has this game in games_left (i.e., current game is the first of remaining),
         # then leaving unlocked means the current game will be simulated (which matches the live reality)
         # We assume current_live_score is the value you'd lock now, but leaving unlocked keeps the uncertainty.
-        res_no_lock = FantasyNBASimulation.estimate_win_probability(your_copy, opp_copy, sims=sims)
+        res_no_lock = FantasyNBASimulation.estimate_win_probability(
+            your_team, opp_team, sims=sims, your_normals=your_normals, opp_normals=opp_normals, dtype=dtype, rng=rng,
+            keep_arrays=keep_arrays
+        )
         p_win_no_lock = res_no_lock["p_win"]
 
         delta = p_win_lock - p_win_no_lock
 
-        # Simple decision rule:
-        # - if locking increases win prob by > threshold, recommend lock
-        # - if decreases by > threshold, recommend wait (i.e., don't lock)
-        # threshold can be tuned; we set a small default like 0.005 (0.5% change)
-        threshold = 0.005
-        if delta > threshold:
-            action = "lock"
-        elif delta < -threshold:
-            action = "wait"
-        else:
-            action = "indifferent"
-
         return {
             "p_win_if_lock": float(p_win_lock),
             "p_win_if_not_lock": float(p_win_no_lock),
             "delta_p_win": float(delta),
-            "recommended_action": action,
+            "recommended_action": FantasyNBASimulation.lock_action(delta),
+            "seed": seed,
             "details": {
                 "res_lock": res_lock,
                 "res_no_lock": res_no_lock
@@ -140,23 +434,69 @@ class FantasyNBASimulation:
     # Batch evaluate all unlockable players and recommend the best one to lock now (if any)
     # ---------------------------
     @staticmethod
-    def recommend_best_lock(your_players, opp_players, sims=20000, min_delta=0.001):
+    def recommend_best_lock(your_players, opp_players, sims=20000, min_delta=0.001, dtype=np.float64, rng=None,
+                            target_precision=None, max_sims=1_000_000, batch_size=10_000, confidence=0.95):
+        """
+        Score every lockable player in a single pass.
+
+        Each player's weekly points, the opponent total and the no-lock team total are simulated
+        once. Locking player i only replaces row i with its live score, so every candidate is
+        scored against the same draws (common random numbers) by swapping that one row.
+
+        Sims run in chunks of batch_size and only per-candidate win counts are kept. With
+        target_precision, batches are added until every candidate's CI half-width on the lock
+        delta is at most the target or max_sims is reached (sims is then ignored).
+
+        Returns:
+            dict: {"evaluations", "top_recommendation", "sims_used", "seed"}; each evaluation has "delta_ci"
+        """
+        your_team = Team.from_players(your_players)
+        opp_team = Team.from_players(opp_players)
+        rng, seed = FantasyNBASimulation.make_rng(rng)
+        live_scores = your_team.data["live_score"]
+        candidates = np.flatnonzero(~np.isnan(live_scores))
+        adaptive = target_precision is not None
+        z = FantasyNBASimulation.z_score(confidence)
+
+        # paired win indicators: the delta's variance comes from the sims where only one branch wins
+        no_lock_wins = sims_used = 0
+        lock_wins = np.zeros(len(candidates))
+        discordant = np.zeros(len(candidates))
+        half_widths = np.zeros(len(candidates))
+        while len(candidates):
+            size = min(batch_size, (max_sims if adaptive else sims) - sims_used)
+            your_columns = FantasyNBASimulation.simulate_player_columns(your_team, sims=size, dtype=dtype, rng=rng)
+            opp_totals = FantasyNBASimulation.simulate_player_columns(opp_team, sims=size, dtype=dtype, rng=rng).sum(axis=0)
+            no_lock_totals = your_columns.sum(axis=0)
+            no_lock_win = no_lock_totals > opp_totals
+            # (candidates x sims): no-lock total with the candidate's row swapped for its live score
+            lock_win = (no_lock_totals - your_columns[candidates] + live_scores[candidates].astype(dtype)[:, None]) > opp_totals
+
+            no_lock_wins += int(np.count_nonzero(no_lock_win))
+            lock_wins += np.count_nonzero(lock_win, axis=1)
+            discordant += np.count_nonzero(lock_win != no_lock_win, axis=1)
+            sims_used += size
+
+            deltas = (lock_wins - no_lock_wins) / sims_used
+            half_widths = z * np.sqrt(np.maximum(discordant / sims_used - deltas ** 2, 0) / sims_used)
+            if adaptive and (half_widths.max() <= target_precision or sims_used >= max_sims):
+                break
+            if not adaptive and sims_used >= sims:
+                break
+
         evaluations = []
-        for idx, p in enumerate(your_players):
-            if p.get("current_live_score") is None:
-                continue
-            ev = FantasyNBASimulation.evaluate_lock_effect(idx, your_players, opp_players, sims=sims)
-            if "error" in ev:
-                continue
-            ev_summary = {
+        for i, idx in enumerate(candidates.tolist()):
+            p_win_no_lock = no_lock_wins / sims_used
+            delta = (lock_wins[i] - no_lock_wins) / sims_used
+            evaluations.append({
                 "player_index": idx,
-                "player_name": your_players[idx]["name"],
-                "p_win_if_lock": ev["p_win_if_lock"],
-                "p_win_if_not_lock": ev["p_win_if_not_lock"],
-                "delta": ev["delta_p_win"],
-                "recommended_action": ev["recommended_action"]
-            }
-            evaluations.append(ev_summary)
+                "player_name": your_team.names[idx],
+                "p_win_if_lock": float(lock_wins[i] / sims_used),
+                "p_win_if_not_lock": float(p_win_no_lock),
+                "delta": float(delta),
+                "delta_ci": (float(delta - half_widths[i]), float(delta + half_widths[i])),
+                "recommended_action": FantasyNBASimulation.lock_action(delta)
+            })
 
         evaluations.sort(key=lambda x: x["delta"], reverse=True)
         top = evaluations[0] if evaluations else None
@@ -168,9 +508,43 @@ class FantasyNBASimulation:
 
         return {
             "evaluations": evaluations,
-            "top_recommendation": top_recommendation
+            "top_recommendation": top_recommendation,
+            "sims_used": sims_used,
+            "seed": seed
         }
 
+    # ---------------------------
+    # Lineup optimizer
+    # ---------------------------
+    # Feasible starting lineups come from bipartite slot matching over the best players by
+    # expected points; the top few are scored on common random numbers (see simulation/lineup.py).
+    @staticmethod
+    def optimize_lineup(players, roster_positions, can_fill, opp_players, current=None, sims=lineup.LINEUP_SIMS,
+                        dtype=np.float64, rng=None):
+        return lineup.optimize_lineup(
+            players, roster_positions, can_fill, opp_players, current=current, sims=sims, dtype=dtype, rng=rng
+        )
+
+    # ---------------------------
+    # Break-even lock scores
+    # ---------------------------
+    # One common-random-number pass gives, for every unlocked player, the live score above which
+    # locking raises p_win (see simulation/thresholds.py). The table only depends on the roster
+    # state excluding live scores, so thresholds.LockThresholdCache answers "lock now?" instantly.
+    @staticmethod
+    def lock_thresholds(your_players, opp_players, sims=thresholds.THRESHOLD_SIMS, dtype=np.float64, rng=None):
+        return thresholds.lock_thresholds(your_players, opp_players, sims=sims, dtype=dtype, rng=rng)
+
+    # ---------------------------
+    # Optimal lock policy over the remaining games
+    # ---------------------------
+    # recommend_best_lock only compares locking now with never locking. With several games left
+    # the decision is an optimal-stopping problem, solved by backward induction on a memoized
+    # value function (see simulation/policy.py); returns every player's per-game lock thresholds.
+    @staticmethod
+    def optimal_lock_policy(your_players, opp_players, step=policy.POLICY_STEP):
+        return policy.optimal_lock_policy(your_players, opp_players, step=step)
+
     # ---------------------------
     # Dynamic threshold helper: returns lock/wait thresholds depending on games remaining
     # ---------------------------
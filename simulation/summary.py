@@ -0,0 +1,107 @@
+import numpy as np
+
+from simulation import exact
+
+HISTOGRAM_BINS = 200
+# Histogram range around each mean, in standard deviations (from the exact engine)
+HISTOGRAM_SIGMAS = 6.0
+# Coarse grid is plenty for choosing histogram ranges
+EDGE_STEP = 0.5
+QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+
+
+def _edges(offset, pmf, bins, step=EDGE_STEP):
+    values = (offset + np.arange(len(pmf))) * step
+    mean = float(np.dot(values, pmf))
+    std = float(np.sqrt(max(np.dot((values - mean) ** 2, pmf), 0.0)))
+    half_range = max(HISTOGRAM_SIGMAS * std, 1.0)
+    return np.linspace(mean - half_range, mean + half_range, bins + 1)
+
+
+class MatchupSummary:
+    """
+    Bounded-memory accumulator for simulated matchups.
+
+    Keeps win/tie counts, first and second moments and fixed-bin histograms of both totals and the
+    margin, so any number of simulation chunks can be folded in (update) and summaries from
+    different workers combined (merge) without keeping per-sim arrays. Histogram edges come from
+    the exact engine, so every chunk and worker bins identically.
+    """
+
+    def __init__(self, your_edges, opp_edges, margin_edges):
+        self.sims = 0
+        self.wins = 0
+        self.ties = 0
+        self.sums = {"your": 0.0, "opp": 0.0, "margin": 0.0}
+        self.sq_sums = {"your": 0.0, "opp": 0.0, "margin": 0.0}
+        self.edges = {"your": your_edges, "opp": opp_edges, "margin": margin_edges}
+        self.counts = {key: np.zeros(len(edges) - 1, dtype=np.int64) for key, edges in self.edges.items()}
+
+    @staticmethod
+    def for_teams(your_team, opp_team, bins=HISTOGRAM_BINS):
+        your_dist = exact.team_distribution(your_team, step=EDGE_STEP)
+        opp_dist = exact.team_distribution(opp_team, step=EDGE_STEP)
+        margin_dist = exact.difference(your_dist, opp_dist)
+        return MatchupSummary(_edges(*your_dist, bins), _edges(*opp_dist, bins), _edges(*margin_dist, bins))
+
+    def update(self, your_totals, opp_totals):
+        your_totals = np.asarray(your_totals, dtype=np.float64)
+        opp_totals = np.asarray(opp_totals, dtype=np.float64)
+        margins = your_totals - opp_totals
+        self.sims += len(margins)
+        self.wins += int(np.count_nonzero(margins > 0))
+        self.ties += int(np.count_nonzero(margins == 0))
+        for key, values in (("your", your_totals), ("opp", opp_totals), ("margin", margins)):
+            edges = self.edges[key]
+            self.sums[key] += float(values.sum())
+            self.sq_sums[key] += float(np.dot(values, values))
+            # out-of-range values land in the end bins
+            self.counts[key] += np.histogram(np.clip(values, edges[0], edges[-1]), bins=edges)[0]
+        return self
+
+    def merge(self, other):
+        self.sims += other.sims
+        self.wins += other.wins
+        self.ties += other.ties
+        for key in self.sums:
+            self.sums[key] += other.sums[key]
+            self.sq_sums[key] += other.sq_sums[key]
+            self.counts[key] += other.counts[key]
+        return self
+
+    def mean(self, key="margin"):
+        return self.sums[key] / self.sims if self.sims else float("nan")
+
+    def std(self, key="margin"):
+        if not self.sims:
+            return float("nan")
+        return float(np.sqrt(max(self.sq_sums[key] / self.sims - self.mean(key) ** 2, 0.0)))
+
+    def quantile(self, q, key="margin"):
+        """Quantile read off the histogram (linear within a bin)."""
+        counts = self.counts[key]
+        edges = self.edges[key]
+        cumulative = np.concatenate(([0], np.cumsum(counts))) / max(counts.sum(), 1)
+        return float(np.interp(q, cumulative, edges))
+
+    def histogram(self, key="margin"):
+        return {"edges": self.edges[key], "counts": self.counts[key]}
+
+    def to_dict(self, confidence=0.95):
+        """Result fields shared by every simulation entry point that summarizes a matchup."""
+        from simulation.simulation import FantasyNBASimulation
+
+        return {
+            "p_win": self.wins / self.sims if self.sims else float("nan"),
+            "p_tie": self.ties / self.sims if self.sims else float("nan"),
+            "expected_margin": self.mean("margin"),
+            "margin_std": self.std("margin"),
+            "your_mean": self.mean("your"),
+            "your_std": self.std("your"),
+            "opp_mean": self.mean("opp"),
+            "opp_std": self.std("opp"),
+            "margin_quantiles": {q: self.quantile(q) for q in QUANTILES},
+            "ci": FantasyNBASimulation.wilson_interval(self.wins, self.sims, confidence),
+            "sims_used": self.sims,
+            "histograms": {key: self.histogram(key) for key in self.edges},
+        }
@@ -0,0 +1,93 @@
+import numpy as np
+
+# One row per player; NaN stands for "not set" in the locked / live score columns
+TEAM_DTYPE = np.dtype([
+    ("mean", "f8"),
+    ("std", "f8"),
+    ("games_left", "i4"),
+    ("locked", "f8"),
+    ("live_score", "f8"),
+])
+
+
+class Team:
+    """
+    Column view of a roster for the simulation engine.
+
+    Holds the same fields as the player dicts the app and CLI build ("name", "mean", "std",
+    "games_left", "locked", "current_live_score") as a structured NumPy array, so changing one
+    player (e.g. locking them) copies a few bytes instead of deep-copying the roster.
+
+    A player without a projection (NaN mean or std, e.g. no qualifying game this season) is
+    stored as scoring 0 points: no games left, mean and std 0. A lock still applies.
+    """
+    __slots__ = ("names", "data")
+
+    def __init__(self, names, data):
+        self.names = tuple(names)
+        self.data = data
+
+    @staticmethod
+    def from_players(players):
+        """Build a Team from a list of player dicts (a Team is returned unchanged)."""
+        if isinstance(players, Team):
+            return players
+        data = np.zeros(len(players), dtype=TEAM_DTYPE)
+        for i, p in enumerate(players):
+            locked = p.get("locked")
+            live_score = p.get("current_live_score")
+            mean = float(p["mean"])
+            std = float(p["std"])
+            games_left = max(int(p.get("games_left") or 0), 0)
+            if not (np.isfinite(mean) and np.isfinite(std)):
+                mean, std, games_left = 0.0, 0.0, 0
+            data[i] = (
+                mean,
+                std,
+                games_left,
+                np.nan if locked is None else float(locked),
+                np.nan if live_score is None else float(live_score),
+            )
+        return Team([p["name"] for p in players], data)
+
+    def to_players(self):
+        players = []
+        for name, row in zip(self.names, self.data):
+            players.append({
+                "name": name,
+                "mean": float(row["mean"]),
+                "std": float(row["std"]),
+                "games_left": int(row["games_left"]),
+                "locked": None if np.isnan(row["locked"]) else float(row["locked"]),
+                "current_live_score": None if np.isnan(row["live_score"]) else float(row["live_score"]),
+            })
+        return players
+
+    def with_lock(self, index, value=None):
+        """Copy of the team with player `index` locked at `value` (default: their live score)."""
+        data = self.data.copy()
+        data["locked"][index] = data["live_score"][index] if value is None else value
+        data["games_left"][index] = 0
+        return Team(self.names, data)
+
+    @staticmethod
+    def concat(*teams):
+        """One Team holding every player of `teams`, in order (e.g. both sides of a matchup)."""
+        teams = [Team.from_players(team) for team in teams]
+        names = [name for team in teams for name in team.names]
+        return Team(names, np.concatenate([team.data for team in teams]) if teams else np.zeros(0, TEAM_DTYPE))
+
+    @property
+    def is_locked(self):
+        return ~np.isnan(self.data["locked"])
+
+    @property
+    def max_games(self):
+        return int(self.data["games_left"].max()) if len(self.data) else 0
+
+    @property
+    def total_games(self):
+        return int(self.data["games_left"].sum())
+
+    def __len__(self):
+        return len(self.data)
@@ -0,0 +1,103 @@
+import hashlib
+
+import numpy as np
+
+from simulation.team import Team
+
+# Sims behind one threshold table; it is built once per roster state, so it can afford many
+THRESHOLD_SIMS = 200_000
+# Quantiles of each player's break-even distribution kept for p_win lookups
+TABLE_POINTS = 1001
+
+
+def fingerprint(your_players, opp_players):
+    """
+    Key of the roster state a threshold table depends on.
+
+    Live scores are left out: an unlocked player's live score doesn't enter the simulation,
+    so score ticks never invalidate the table; a lock or a changed projection does.
+    """
+    digest = hashlib.sha1()
+    for team in (Team.from_players(your_players), Team.from_players(opp_players)):
+        for field in ("mean", "std", "games_left", "locked"):
+            digest.update(np.ascontiguousarray(team.data[field]).tobytes())
+        digest.update(b"|")
+    return digest.hexdigest()
+
+
+def lock_thresholds(your_players, opp_players, sims=THRESHOLD_SIMS, dtype=np.float64, rng=None):
+    """
+    Break-even lock score for every unlocked player of yours, from one common-random-number pass.
+
+    With the no-lock team total T, player i's column X_i and the opponent total O on shared
+    draws, locking i at score L wins when L > D_i = O - (T - X_i). So P(win | lock at L) is the
+    empirical CDF of D_i, and the break-even score is the root of
+    P(D_i < L) = P(T > O), read off the sorted D_i at the no-lock win count.
+
+    Returns:
+        dict: {"players": {index: {"player_name", "break_even", "quantiles"}},
+               "p_win_if_not_lock", "fingerprint", "sims_used", "seed"}
+    """
+    from simulation.simulation import FantasyNBASimulation
+
+    your_team = Team.from_players(your_players)
+    opp_team = Team.from_players(opp_players)
+    rng, seed = FantasyNBASimulation.make_rng(rng)
+    your_columns = FantasyNBASimulation.simulate_player_columns(your_team, sims=sims, dtype=dtype, rng=rng)
+    opp_totals = FantasyNBASimulation.simulate_player_columns(opp_team, sims=sims, dtype=dtype, rng=rng).sum(axis=0)
+    no_lock_totals = your_columns.sum(axis=0)
+    no_lock_wins = int(np.count_nonzero(no_lock_totals > opp_totals))
+
+    players = {}
+    levels = np.linspace(0, 1, TABLE_POINTS)
+    for i in np.flatnonzero(~your_team.is_locked).tolist():
+        needed = np.sort(opp_totals - (no_lock_totals - your_columns[i]))
+        # locking at L wins #(D < L) sims, which beats the no-lock wins exactly when L > needed[no_lock_wins]
+        players[i] = {
+            "player_name": your_team.names[i],
+            "break_even": float(needed[min(no_lock_wins, sims - 1)]),
+            "quantiles": np.quantile(needed, levels),
+        }
+    return {
+        "players": players,
+        "p_win_if_not_lock": no_lock_wins / sims,
+        "fingerprint": fingerprint(your_team, opp_team),
+        "sims_used": sims,
+        "seed": seed,
+    }
+
+
+class LockThresholdCache:
+    """
+    Threshold table for the current roster state, rebuilt only when its fingerprint changes.
+
+    Answering "lock now?" for a live score is then a comparison and an interpolation.
+    """
+
+    def __init__(self, sims=THRESHOLD_SIMS, dtype=np.float64, rng=None):
+        self.sims = sims
+        self.dtype = dtype
+        self.rng = rng
+        self.table = None
+
+    def get(self, your_players, opp_players):
+        if self.table is None or self.table["fingerprint"] != fingerprint(your_players, opp_players):
+            self.table = lock_thresholds(your_players, opp_players, sims=self.sims, dtype=self.dtype, rng=self.rng)
+        return self.table
+
+    def decide(self, your_players, opp_players, player_index, live_score):
+        """
+        Returns:
+            dict: {"lock", "break_even", "p_win_if_lock", "p_win_if_not_lock"}
+        """
+        table = self.get(your_players, opp_players)
+        entry = table["players"].get(player_index)
+        if entry is None:
+            return {"error": "player is already locked", "lock": False}
+        quantiles = entry["quantiles"]
+        return {
+            "lock": bool(live_score > entry["break_even"]),
+            "break_even": entry["break_even"],
+            "p_win_if_lock": float(np.interp(live_score, quantiles, np.linspace(0, 1, len(quantiles)))),
+            "p_win_if_not_lock": table["p_win_if_not_lock"],
+        }
@@ -1,13 +1,19 @@
 from .helpers import (
     get_my_team_and_opponent_team,
+    get_week_matchup_pairs,
+    get_league_week_players,
     get_player_names_from_team_data,
     get_week_data_filename,
-    player_names_to_fantasy_stats
+    player_names_to_fantasy_stats,
+    sleeper_ids_to_fantasy_stats
 )
 
 __all__ = [
     'get_my_team_and_opponent_team',
+    'get_week_matchup_pairs',
+    'get_league_week_players',
     'get_player_names_from_team_data',
     'get_week_data_filename',
-    'player_names_to_fantasy_stats'
+    'player_names_to_fantasy_stats',
+    'sleeper_ids_to_fantasy_stats'
 ]
\ No newline at end of file
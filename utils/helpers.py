@@ -1,9 +1,12 @@
 import json
 import os
-import time
+import numpy as np
 from api.sleeper_api import SleeperAPI
 from api.nba_client import NBAApiClient
+from api.rate_limit import call_with_retries, fetch_concurrently
 from models.fantasy_data import FantasyData
+from data.game_log_store import GameLogStore
+from data.player_directory import PlayerDirectory
 from datetime import datetime, date
 
 
@@ -46,6 +49,61 @@ def get_my_team_and_opponent_team(roster_id, matchups):
     return team_matchup_data, opponent_matchup_data
 
 
+def get_week_matchup_pairs(matchups):
+    """
+    Head-to-head pairs of a week's matchups.
+    
+    Args:
+        matchups (list): Matchups from SleeperAPI.get_week_matchups
+    
+    Returns:
+        list: (roster_id, roster_id) tuples ordered by matchup_id; byes are skipped
+    """
+    roster_ids_by_matchup = {}
+    for matchup in matchups:
+        if matchup.get('matchup_id') is not None:
+            roster_ids_by_matchup.setdefault(matchup['matchup_id'], []).append(matchup['roster_id'])
+    return [tuple(roster_ids) for _, roster_ids in sorted(roster_ids_by_matchup.items()) if len(roster_ids) == 2]
+
+
+def get_league_week_players(matchups, scoring_settings=None, games_left=1, max_workers=4):
+    """
+    Simulation players for every roster in a week, loading each player's stats only once.
+    
+    Args:
+        matchups (list): Matchups from SleeperAPI.get_week_matchups
+        scoring_settings (dict): League scoring_settings, defaults to standard sleeper scoring
+        games_left (int): Games left assumed for every starter
+        max_workers (int): Concurrent per-player fetches
+    
+    Returns:
+        dict: roster_id -> list of player dicts (name, mean, std, games_left, locked); players
+            without a projection get mean and std 0
+    """
+    starters = {
+        matchup['roster_id']: [p for p in (matchup.get('starters') or []) if p and p != '0']
+        for matchup in matchups
+    }
+    # players can start for more than one roster (e.g. stale lineups), fetch each once
+    player_ids = list(dict.fromkeys(p for roster_starters in starters.values() for p in roster_starters))
+    stats = sleeper_ids_to_fantasy_stats(player_ids, scoring_settings, max_workers)
+    names = dict(zip(player_ids, PlayerDirectory.names_for(player_ids)))
+
+    return {
+        roster_id: [
+            {
+                "name": names[player_id],
+                "mean": stats.get(player_id, (0, 0, 0))[0],
+                "std": stats.get(player_id, (0, 0, 0))[1],
+                "games_left": games_left,
+                "locked": None
+            }
+            for player_id in roster_starters
+        ]
+        for roster_id, roster_starters in starters.items()
+    }
+
+
 def get_player_names_from_team_data(team_data):
     """
     Get player names from team data using sleeper IDs.
@@ -56,11 +114,7 @@ def get_player_names_from_team_data(team_data):
     Returns:
         list: List of player names
     """
-    player_names = []
-    for sleeper_id in team_data['starters']:
-        player_name = SleeperAPI.get_name_from_sleeper_id(sleeper_id)
-        player_names.append(player_name)
-    return player_names
+    return PlayerDirectory.names_for(team_data['starters'])
 
 
 def get_week_data_filename(week):
@@ -68,28 +122,72 @@ def get_week_data_filename(week):
     return f"week_{week}_fantasy_data.json"
 
 
-def player_names_to_fantasy_stats(player_names):
+def player_names_to_fantasy_stats(player_names, scoring_settings=None, max_workers=4):
     """
     Convert player names to fantasy stats (mean and std).
     
     Args:
         player_names (list): List of player names
+        scoring_settings (dict): League scoring_settings from SleeperAPI.get_league_info.
+            Defaults to standard sleeper scoring.
+        max_workers (int): Concurrent per-player fetches; the request rate is capped by
+            NBAApiClient.RATE_LIMITER regardless
     
     Returns:
         dict: Dictionary mapping player names to (mean, std) tuples
     """
+    return _fantasy_stats(player_names, NBAApiClient.get_player_id_from_name, scoring_settings, max_workers)
+
+
+def sleeper_ids_to_fantasy_stats(sleeper_ids, scoring_settings=None, max_workers=4):
+    """
+    Convert Sleeper player ids to fantasy stats, resolving NBA ids through the crosswalk.
+    
+    Args:
+        sleeper_ids (list): List of Sleeper player ids
+        scoring_settings (dict): League scoring_settings, defaults to standard sleeper scoring
+        max_workers (int): Concurrent per-player fetches
+    
+    Returns:
+        dict: Dictionary mapping Sleeper ids to (mean, std, games_played) tuples
+    """
+    def resolve(sleeper_id):
+        return NBAApiClient.get_player_id_from_sleeper_id(
+            sleeper_id, player_name=PlayerDirectory.name_for(sleeper_id)
+        )
+    return _fantasy_stats(sleeper_ids, resolve, scoring_settings, max_workers)
+
+
+def _fantasy_stats(keys, resolve_player_id, scoring_settings, max_workers):
+    store = GameLogStore()
+    try:
+        # one league-wide request fills the store for every player at once
+        call_with_retries(store.sync_league)
+    except Exception as e:
+        print(f"League-wide game log sync failed, falling back to per-player fetches: {e}")
+
+    def load_game_log(key):
+        player_id = resolve_player_id(key)
+        # served from the local store, only fetched per player if the league sync is stale
+        return store.get_game_log(player_id)
+
+    game_logs, errors = fetch_concurrently(load_game_log, keys, max_workers=max_workers)
+
     player_fantasy_stats = {}
-    for name in player_names:
+    for key in keys:
+        if key in errors:
+            print(f"Error processing player {key}: {errors[key]}")
+            continue
         try:
-            player_id = NBAApiClient.get_player_id_from_name(name)
-            time.sleep(0.5)
-            game_log = NBAApiClient.get_player_game_log(player_id)
-            time.sleep(0.5)
-            mean, stddev = FantasyData.get_fantasy_stats(game_log)
+            game_log = game_logs[key]
+            mean, stddev = FantasyData.get_fantasy_stats(game_log, scoring_settings)
+            if not (np.isfinite(mean) and np.isfinite(stddev)):
+                # no qualifying game this season (injured, rookie, only short games): project 0 points
+                mean, stddev = 0.0, 0.0
             num_games = len(game_log)
-            player_fantasy_stats[name] = (mean, stddev, num_games)
+            player_fantasy_stats[key] = (mean, stddev, num_games)
         except Exception as e:
-            print(f"Error processing player {name}: {e}")
+            print(f"Error processing player {key}: {e}")
     return player_fantasy_stats
 
 